@@ -1,19 +1,215 @@
+import os
+import time
+
+import Core.Base as Base
 from Core.Log import *
 from Core.Base import *
+from Core.Delegate import DeferredEventQueue
+from Core.Layer import Layer, LayerStack
+from Core.Timer import sleep_until
+from Core.Timestep import Timestep
+from Debug.Profiler import SAW_PROFILE_MARK_FRAME, SAW_PROFILE_SCOPE, SAW_PROFILE_THREAD
 
-class Application:
+class ApplicationSpecification:
     def __init__(self):
-        Log.init()
+        self.simulation_rate = 240.0    # fixed updates per second
+        self.render_rate = 60.0         # render ticks per second
+        self.io_rate = 10.0             # I/O ticks per second
+        self.max_catch_up_steps = 8     # fixed updates allowed per frame before dropping time
+        self.stats_log_interval = 5.0   # seconds between frame-time reports, 0 to disable
+
+class FrameStats:
+    """
+    Per-frame work time (excluding the idle wait). Run totals are kept
+    separately from a bounded ring of recent frame times; the periodic log
+    reads the frames since the last reset_window(), summary() the whole run.
+    """
+
+    def __init__(self, capacity: int = 4096):
+        self._times = [0.0] * capacity
+        self._window_start = 0    # frame count at the last reset_window()
+        self.frames = 0
+        self.total_time = 0.0
+        self.min_time = float("inf")
+        self.max_time = 0.0
+        self.overruns = 0         # frames that hit max_catch_up_steps
+        self.dropped_time = 0.0   # simulation seconds discarded by overruns
+
+    def record(self, frame_time: float):
+        self._times[self.frames % len(self._times)] = frame_time
+        self.frames += 1
+        self.total_time += frame_time
+        self.min_time = min(self.min_time, frame_time)
+        self.max_time = max(self.max_time, frame_time)
+
+    def _recent(self, count: int) -> list[float]:
+        count = min(count, self.frames, len(self._times))
+        return [self._times[i % len(self._times)] for i in range(self.frames - count, self.frames)]
+
+    def window(self) -> list[float]:
+        """Frame times since the last reset_window(), at most `capacity` of them."""
+        return self._recent(self.frames - self._window_start)
+
+    def window_summary(self) -> dict:
+        times = sorted(self.window())
+        if not times:
+            return {"frames": 0, "min": 0.0, "avg": 0.0, "p99": 0.0, "max": 0.0, "overruns": self.overruns}
+        return {
+            "frames": len(times),
+            "min": times[0],
+            "avg": sum(times) / len(times),
+            "p99": times[min(len(times) - 1, int(len(times) * 0.99))],
+            "max": times[-1],
+            "overruns": self.overruns,
+        }
+
+    def summary(self) -> dict:
+        """Totals for the whole run; p99 covers the most recent `capacity` frames."""
+        if not self.frames:
+            return {"frames": 0, "min": 0.0, "avg": 0.0, "p99": 0.0, "max": 0.0, "overruns": self.overruns}
+        recent = sorted(self._recent(len(self._times)))
+        return {
+            "frames": self.frames,
+            "min": self.min_time,
+            "avg": self.total_time / self.frames,
+            "p99": recent[min(len(recent) - 1, int(len(recent) * 0.99))],
+            "max": self.max_time,
+            "overruns": self.overruns,
+        }
+
+    def reset_window(self):
+        self._window_start = self.frames
+
+class Application:
+    def __init__(self, specification: ApplicationSpecification | None = None):
+        # Logging sets itself up on the first message; an explicit Log.init() made
+        # earlier (e.g. asynchronous) is kept rather than replaced
         self.version = VERSION
+        self.specification = specification or ApplicationSpecification()
+        self.layer_stack = LayerStack()
+        self.events = DeferredEventQueue()  # worker threads post here; dispatched on the main loop
+        self.frame_stats = FrameStats()
+        self.running = True
+        self._sampling_profiler = None
+        if os.getenv("SAW_PROFILE_SAMPLING", "0") == "1":
+            self.set_sampling_profiler_enabled(True)
         SAW_DT_INFO(f"Application initialized. Version: {self.version}")
 
     def get_version_info(self):
         SAW_DT_INFO(f"Version: {self.version}")
         return f"Version: {self.version}"
 
+    def push_layer(self, layer: Layer):
+        self.layer_stack.push_layer(layer)
+
+    def pop_layer(self, layer: Layer):
+        self.layer_stack.pop_layer(layer)
+
+    def close(self):
+        self.running = False
+
+    @property
+    def sampling_profiler(self):
+        # Created on first use so applications that never sample don't import it
+        if self._sampling_profiler is None:
+            from Debug.SamplingProfiler import SamplingProfiler
+            self._sampling_profiler = SamplingProfiler()
+        return self._sampling_profiler
+
+    def set_sampling_profiler_enabled(self, enabled: bool):
+        """Toggle whole-program sampling at runtime (set SAW_PROFILE_SAMPLING=1 to start enabled)."""
+        self.sampling_profiler.set_enabled(enabled)
+        SAW_DT_INFO(f"Sampling profiler {'enabled' if self.sampling_profiler.is_running() else 'disabled'}")
+
+    def write_sampling_profile(self, filepath: str = "profile.collapsed"):
+        self.sampling_profiler.write_collapsed(filepath)
+        SAW_DT_INFO(f"Wrote {self.sampling_profiler.samples} samples to '{filepath}' "
+                    f"(overhead {self.sampling_profiler.overhead() * 100.0:.2f}%)")
+
+    def _log_frame_stats(self, stats: dict):
+        SAW_DT_TRACE("Frames %d | frame time min %.3f ms avg %.3f ms p99 %.3f ms | overruns %d",
+                     stats["frames"], stats["min"] * 1e3, stats["avg"] * 1e3, stats["p99"] * 1e3,
+                     stats["overruns"])
+
     def run(self):
-        global application_running
-        while application_running:
-            SAW_INFO("Application is running...")
-            import time
-            time.sleep(1)
+        """
+        Fixed-timestep loop: simulation layers advance in fixed steps drawn from
+        an accumulator (at most max_catch_up_steps per frame; any further backlog
+        is dropped and counted as an overrun), while render and I/O ticks run on
+        their own clocks. Between deadlines the thread sleeps precisely.
+        """
+        spec = self.specification
+        fixed_dt = 1.0 / spec.simulation_rate
+        render_interval = 1.0 / spec.render_rate if spec.render_rate > 0.0 else None
+        io_interval = 1.0 / spec.io_rate if spec.io_rate > 0.0 else None
+        fixed_step = Timestep(fixed_dt)
+
+        SAW_PROFILE_THREAD("Main")
+        SAW_DT_INFO(f"Application running at {spec.simulation_rate:g} Hz simulation, "
+                    f"{spec.render_rate:g} Hz render, {spec.io_rate:g} Hz I/O")
+
+        now = time.perf_counter()
+        previous = now
+        accumulator = 0.0
+        last_render = last_io = last_stats = now
+        next_render = now + (render_interval or 0.0)
+        next_io = now + (io_interval or 0.0)
+
+        while self.running and Base.application_running:
+            now = time.perf_counter()
+            frame_time = now - previous
+            previous = now
+            SAW_PROFILE_MARK_FRAME()
+
+            if self.events.pending():
+                with SAW_PROFILE_SCOPE("Application::Events"):
+                    self.events.dispatch()
+
+            accumulator += frame_time
+            steps = 0
+            with SAW_PROFILE_SCOPE("Application::Simulate"):
+                while accumulator >= fixed_dt and steps < spec.max_catch_up_steps:
+                    for layer in self.layer_stack:
+                        layer.on_update(fixed_step)
+                    accumulator -= fixed_dt
+                    steps += 1
+            if accumulator >= fixed_dt:
+                # Can't keep up: drop the backlog rather than spiral
+                self.frame_stats.overruns += 1
+                self.frame_stats.dropped_time += accumulator - accumulator % fixed_dt
+                accumulator %= fixed_dt
+
+            if render_interval is not None and now >= next_render:
+                with SAW_PROFILE_SCOPE("Application::Render"):
+                    ts = Timestep(now - last_render)
+                    for layer in self.layer_stack:
+                        layer.on_render(ts)
+                last_render = now
+                next_render = max(next_render + render_interval, now)
+
+            if io_interval is not None and now >= next_io:
+                with SAW_PROFILE_SCOPE("Application::IO"):
+                    ts = Timestep(now - last_io)
+                    for layer in self.layer_stack:
+                        layer.on_io(ts)
+                last_io = now
+                next_io = max(next_io + io_interval, now)
+
+            if spec.stats_log_interval > 0.0 and now - last_stats >= spec.stats_log_interval:
+                self._log_frame_stats(self.frame_stats.window_summary())
+                self.frame_stats.reset_window()
+                last_stats = now
+
+            self.frame_stats.record(time.perf_counter() - now)
+
+            # Wake for whichever clock is due next
+            deadline = now + (fixed_dt - accumulator)
+            if render_interval is not None:
+                deadline = min(deadline, next_render)
+            if io_interval is not None:
+                deadline = min(deadline, next_io)
+            sleep_until(deadline)
+
+        self.layer_stack.clear()
+        self._log_frame_stats(self.frame_stats.summary())
+        SAW_DT_INFO("Application stopped")
@@ -1,9 +1,18 @@
 from typing import TypeVar, Generic
 import ctypes
+import struct
+import threading
 
 T = TypeVar('T')
 
 
+def _format_of(typ) -> tuple[str, int]:
+    # struct format character and size for a ctypes type or format string
+    if isinstance(typ, str):
+        return typ, struct.calcsize(typ)
+    return typ._type_, ctypes.sizeof(typ)
+
+
 class Buffer:
     def __init__(self, size: int = 0):
         self.data: bytearray | None = None
@@ -15,10 +24,23 @@ class Buffer:
     def copy(other: 'Buffer') -> 'Buffer':
         result = Buffer(other.size)
         if other.data is not None:
-            result.data[:] = other.data[:]
+            result.data[:] = other.data[:other.size]
         return result
 
+    @property
+    def capacity(self) -> int:
+        return len(self.data) if self.data is not None else 0
+
     def allocate(self, size: int):
+        """
+        Make room for `size` zeroed bytes. Existing storage is reused (and its
+        first `size` bytes cleared) when it is large enough, so `data` can be
+        longer than `size`; only the first `size` bytes are the buffer.
+        """
+        if self.data is not None and len(self.data) >= size and size > 0:
+            ctypes.memset((ctypes.c_char * size).from_buffer(self.data), 0, size)
+            self.size = size
+            return
         self.release()
         self.data = bytearray(size)
         self.size = size
@@ -28,31 +50,139 @@ class Buffer:
         self.size = 0
 
     def as_type(self, typ: type[T]) -> list[T]:
-        """Return the buffer interpreted as a list of type T (like casting)."""
+        """Return the buffer interpreted as a list of type T (like casting). Copies; see view()."""
         if self.data is None:
             return []
-        # Compute how many elements of type T fit
-        element_size = ctypes.sizeof(typ)
-        count = self.size // element_size
-        arr = (typ * count).from_buffer(self.data)
-        return list(arr)
+        if isinstance(typ, str) or isinstance(getattr(typ, "_type_", None), str):
+            return self.view(typ).tolist()
+        # Structures, unions and arrays have no struct format; map them with ctypes
+        count = self.size // ctypes.sizeof(typ)
+        return list((typ * count).from_buffer(self.data))
+
+    def view(self, typ: type[T] | str, offset: int = 0, count: int | None = None) -> memoryview:
+        """
+        Zero-copy typed view of the buffer: a memoryview cast to a ctypes type
+        (e.g. ctypes.c_float) or struct format ('f', 'I', ...) starting at byte
+        `offset`. `count` defaults to as many elements as fit.
+        """
+        fmt, element_size = _format_of(typ)
+        available = max(self.size - offset, 0) // element_size
+        count = available if count is None else count
+        if offset < 0 or count > available:
+            raise IndexError(f"View of {count} x {element_size} bytes at {offset} exceeds buffer of {self.size}")
+        if self.data is None:
+            return memoryview(b"").cast(fmt)
+        return memoryview(self.data)[offset:offset + count * element_size].cast(fmt)
+
+    def as_array(self, dtype, offset: int = 0, count: int = -1):
+        """Zero-copy NumPy array over the buffer (numpy.frombuffer)."""
+        import numpy as np
+        if self.data is None:
+            return np.zeros(0, dtype=dtype)
+        return np.frombuffer(memoryview(self.data)[:self.size], dtype=dtype, count=count, offset=offset)
+
+    def slice(self, offset: int, size: int) -> memoryview:
+        """Zero-copy byte view of [offset, offset + size)."""
+        if offset < 0 or size < 0 or offset + size > self.size:
+            raise IndexError(f"Slice [{offset}, {offset + size}) exceeds buffer of {self.size}")
+        return memoryview(self.data)[offset:offset + size]
 
     def __bool__(self) -> bool:
         return self.data is not None
 
 
+class BufferPool:
+    """
+    Size-classed pool of reusable Buffer storage. Sizes are rounded up to a
+    power of two (at least MIN_SIZE) and each class keeps up to
+    `max_per_class` free blocks, so hot paths stop hitting the allocator.
+    """
+
+    MIN_SIZE = 4096
+
+    def __init__(self, max_per_class: int = 8):
+        self.max_per_class = max_per_class
+        self._free: dict[int, list[bytearray]] = {}
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def size_class(size: int) -> int:
+        return max(BufferPool.MIN_SIZE, 1 << max(size - 1, 0).bit_length())
+
+    def acquire(self, size: int) -> Buffer:
+        """Return a Buffer of `size` bytes backed by pooled storage (contents unspecified)."""
+        capacity = BufferPool.size_class(size)
+        with self._lock:
+            free = self._free.get(capacity)
+            storage = free.pop() if free else None
+        buffer = Buffer()
+        buffer.data = storage if storage is not None else bytearray(capacity)
+        buffer.size = size
+        return buffer
+
+    def release(self, buffer: Buffer):
+        """Take the storage back from `buffer` (which becomes empty) for later reuse."""
+        storage = buffer.data
+        buffer.release()
+        if storage is None or len(storage) != BufferPool.size_class(len(storage)):
+            return
+        with self._lock:
+            free = self._free.setdefault(len(storage), [])
+            if len(free) < self.max_per_class:
+                free.append(storage)
+
+    def clear(self):
+        with self._lock:
+            self._free.clear()
+
+    def free_bytes(self) -> int:
+        with self._lock:
+            return sum(capacity * len(blocks) for capacity, blocks in self._free.items())
+
+
 class ScopedBuffer:
-    def __init__(self, buffer_or_size: int | Buffer):
+    """
+    Owns a Buffer until close() or destruction. Storage acquired from `pool`
+    goes back to it; a Buffer passed in by the caller is only released, never
+    handed to the pool.
+    """
+
+    def __init__(self, buffer_or_size: int | Buffer, pool: BufferPool | None = None):
+        self._pool = None
         if isinstance(buffer_or_size, Buffer):
             self._buffer = buffer_or_size
+        elif pool is not None:
+            self._pool = pool
+            self._buffer = pool.acquire(buffer_or_size)
         else:
             self._buffer = Buffer(buffer_or_size)
 
     def __del__(self):
-        self._buffer.release()
+        self.close()
+
+    def close(self):
+        """Return storage acquired from the pool to it; otherwise just release the buffer."""
+        buffer = getattr(self, "_buffer", None)
+        if buffer is None:
+            return
+        if self._pool is not None:
+            self._pool.release(buffer)
+        else:
+            buffer.release()
+
+    def __enter__(self) -> 'ScopedBuffer':
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    @property
+    def buffer(self) -> Buffer:
+        return self._buffer
 
     @property
     def data(self) -> bytearray | None:
+        """Backing storage; pooled storage can be longer than `size`, see Buffer.slice()."""
         return self._buffer.data
 
     @property
@@ -62,5 +192,8 @@ class ScopedBuffer:
     def as_type(self, typ: type[T]) -> list[T]:
         return self._buffer.as_type(typ)
 
+    def view(self, typ: type[T] | str, offset: int = 0, count: int | None = None) -> memoryview:
+        return self._buffer.view(typ, offset, count)
+
     def __bool__(self) -> bool:
-        return bool(self._buffer)
\ No newline at end of file
+        return bool(self._buffer)
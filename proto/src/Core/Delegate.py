@@ -1,17 +1,70 @@
-from typing import Callable, Generic, TypeVar, List, Optional
+import itertools
+import threading
+import weakref
+from collections import deque
+from typing import Callable, Generic, TypeVar, Optional, Hashable
 
 T = TypeVar("T")
 TReturn = TypeVar("TReturn")
 
+# Opaque id returned by bind(); pass it to unbind() for O(1) removal
+DelegateHandle = int
+
+_next_handle = itertools.count(1)
+
+
+def _weak_callable(func: Callable, on_dead: Callable[[], None]) -> Callable:
+    """Wrap func so it doesn't keep its owner (for bound methods) or itself alive."""
+    if hasattr(func, "__self__") and hasattr(func, "__func__"):
+        ref = weakref.WeakMethod(func, lambda _: on_dead())
+    else:
+        ref = weakref.ref(func, lambda _: on_dead())
+
+    def call(*args, **kwargs):
+        target = ref()
+        if target is not None:
+            return target(*args, **kwargs)
+        return None
+    return call
+
+
+def _binding_key(func: Callable, weak: bool = False) -> Hashable:
+    """
+    Key identifying a callback across bind/unbind calls. Weak bindings never
+    put the callable itself in the key (that would keep it alive); ids stay
+    unique because a weak binding removes its key when the callable dies.
+    """
+    if hasattr(func, "__self__") and hasattr(func, "__func__"):
+        # Bound methods are recreated on every attribute access: key by function and owner
+        return "method", id(func.__func__), id(func.__self__)
+    if weak:
+        return "id", id(func)
+    try:
+        hash(func)
+    except TypeError:
+        # Callable defining __eq__ without __hash__: fall back to identity (the binding holds func)
+        return "id", id(func)
+    return "callable", func
+
+
 class Delegate(Generic[TReturn]):
     """Single-cast delegate for a callback function."""
 
     def __init__(self):
         self._callback: Optional[Callable] = None
 
-    def bind(self, func: Callable[..., TReturn]):
-        """Bind a free function, lambda, or method."""
-        self._callback = func
+    def bind(self, func: Callable[..., TReturn], weak: bool = False):
+        """Bind a free function, lambda, or method. weak=True doesn't keep a bound method's owner alive."""
+        if weak:
+            callback = None
+
+            def on_dead():
+                if self._callback is callback:
+                    self._callback = None
+            callback = _weak_callable(func, on_dead)
+            self._callback = callback
+        else:
+            self._callback = func
 
     def unbind(self):
         """Remove binding."""
@@ -24,36 +77,136 @@ class Delegate(Generic[TReturn]):
         return self.is_bound()
 
     def invoke(self, *args, **kwargs) -> TReturn:
-        if not self.is_bound():
+        callback = self._callback
+        if callback is None:
             raise RuntimeError("Trying to invoke unbound delegate.")
-        return self._callback(*args, **kwargs)
+        return callback(*args, **kwargs)
 
 
 class MulticastDelegate(Generic[TReturn]):
-    """Multicast delegate for multiple callbacks."""
+    """
+    Multicast delegate for multiple callbacks. Callbacks live in an immutable
+    tuple that bind/unbind replace under a lock (copy-on-write), so invoke
+    iterates a snapshot without copying or locking and is safe to call from
+    any thread while others bind or unbind.
+    """
 
     def __init__(self):
-        self._callbacks: List[Callable[..., TReturn]] = []
-
-    def bind(self, func: Callable[..., TReturn]):
-        """Add a callback."""
-        if func not in self._callbacks:
-            self._callbacks.append(func)
-
-    def unbind(self, func: Callable[..., TReturn]):
-        """Remove a callback."""
-        if func in self._callbacks:
-            self._callbacks.remove(func)
+        self._callbacks: tuple[Callable[..., TReturn], ...] = ()
+        self._entries: dict[DelegateHandle, Callable[..., TReturn]] = {}
+        self._handles: dict[Hashable, DelegateHandle] = {}  # _binding_key(callback) -> handle
+        self._keys: dict[DelegateHandle, Hashable] = {}
+        # Reentrant: a weak owner can be collected (and unbind itself) while the lock is held
+        self._lock = threading.RLock()
+
+    def bind(self, func: Callable[..., TReturn], weak: bool = False) -> DelegateHandle:
+        """
+        Add a callback and return its handle. Binding the same callback again
+        returns the existing handle. Weak bindings unbind themselves when the
+        callback (or a bound method's owner) dies and can also be removed by
+        passing the callback to unbind().
+        """
+        with self._lock:
+            handle = self._find_handle(func)
+            if handle is not None:
+                return handle
+            key = _binding_key(func, weak)
+            handle = next(_next_handle)
+            if weak:
+                self._entries[handle] = _weak_callable(func, lambda: self.unbind(handle))
+            else:
+                self._entries[handle] = func
+            self._handles[key] = handle
+            self._keys[handle] = key
+            self._callbacks = tuple(self._entries.values())
+            return handle
+
+    def _find_handle(self, func: Callable) -> DelegateHandle | None:
+        handle = self._handles.get(_binding_key(func))
+        return handle if handle is not None else self._handles.get(_binding_key(func, weak=True))
+
+    def unbind(self, func_or_handle: Callable[..., TReturn] | DelegateHandle):
+        """Remove a callback by the handle bind() returned, or by the callback itself."""
+        with self._lock:
+            if isinstance(func_or_handle, int):
+                handle = func_or_handle
+            else:
+                handle = self._find_handle(func_or_handle)
+            if self._entries.pop(handle, None) is None:
+                return
+            key = self._keys.pop(handle, None)
+            if key is not None:
+                del self._handles[key]
+            self._callbacks = tuple(self._entries.values())
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self._handles.clear()
+            self._keys.clear()
+            self._callbacks = ()
 
     def is_bound(self) -> bool:
         return len(self._callbacks) > 0
 
     def __bool__(self):
-        return self.is_bound()
+        return len(self._callbacks) > 0
+
+    def __len__(self):
+        return len(self._callbacks)
 
     def invoke(self, *args, **kwargs):
-        if not self.is_bound():
+        callbacks = self._callbacks
+        if not callbacks:
             raise RuntimeError("Trying to invoke unbound multicast delegate.")
-        # Iterate over a copy to prevent modification during iteration
-        for callback in list(self._callbacks):
-            callback(*args, **kwargs)
\ No newline at end of file
+        for callback in callbacks:
+            callback(*args, **kwargs)
+
+
+class DeferredEventQueue:
+    """
+    Collects delegate invocations raised on any thread and runs them later on
+    the thread that calls dispatch() (the Application main loop). post() keeps
+    every event in order; post_latest() keeps only the newest arguments per
+    delegate until the next dispatch, which suits high-rate progress updates.
+    """
+
+    def __init__(self):
+        self._events: deque[tuple] = deque()
+        self._latest: dict = {}
+        self._lock = threading.Lock()
+
+    def post(self, delegate, *args, **kwargs):
+        # deque.append is atomic, so producers never take a lock
+        self._events.append((delegate, args, kwargs))
+
+    def post_latest(self, delegate, *args, **kwargs):
+        with self._lock:
+            self._latest[delegate] = (args, kwargs)
+
+    def pending(self) -> int:
+        return len(self._events) + len(self._latest)
+
+    def dispatch(self, max_events: int | None = None) -> int:
+        """Invoke queued events on the calling thread; returns how many ran."""
+        if self._latest:
+            with self._lock:
+                latest, self._latest = self._latest, {}
+        else:
+            latest = None
+
+        count = 0
+        events = self._events
+        limit = len(events) if max_events is None else min(max_events, len(events))
+        for _ in range(limit):
+            delegate, args, kwargs = events.popleft()
+            if delegate:
+                delegate.invoke(*args, **kwargs)
+            count += 1
+
+        if latest:
+            for delegate, (args, kwargs) in latest.items():
+                if delegate:
+                    delegate.invoke(*args, **kwargs)
+                count += 1
+        return count
@@ -46,6 +46,87 @@ class FastRandom:
             return low
         return low + self.get_uint32() // (0xFFFFFFFF // (high - low + 1) + 1)
 
+    # Jump-ahead: the Lehmer generator's n-th state is a^n * seed mod m
+    def skip(self, n: int):
+        """Advance the state by n draws in O(log n)."""
+        if n < 0:
+            raise ValueError("Cannot skip a negative number of draws")
+        self.state = (pow(FastRandom.LCG_MULTIPLIER, n, FastRandom.LCG_MODULUS) * self.state) % FastRandom.LCG_MODULUS
+
+    def substream(self, index: int, length: int) -> 'FastRandom':
+        """
+        Return a generator positioned at draw index * length of this stream, so
+        workers given different indices consume non-overlapping blocks of `length` draws.
+        """
+        stream = FastRandom(self.state)
+        stream.skip(index * length)
+        return stream
+
+    # Bulk generation: identical sequences to repeated scalar calls
+    BULK_BLOCK_SIZE = 1 << 16
+    _bulk_multipliers = None
+
+    @staticmethod
+    def _get_bulk_multipliers():
+        # a^1 .. a^BLOCK mod m, built by doubling so it costs log2(BLOCK) array ops
+        if FastRandom._bulk_multipliers is None:
+            import numpy as np
+            m = FastRandom.LCG_MODULUS
+            powers = np.empty(FastRandom.BULK_BLOCK_SIZE, dtype=np.int64)
+            powers[0] = FastRandom.LCG_MULTIPLIER % m
+            filled = 1
+            while filled < powers.size:
+                count = min(filled, powers.size - filled)
+                powers[filled:filled + count] = (powers[:count] * powers[filled - 1]) % m
+                filled += count
+            FastRandom._bulk_multipliers = powers
+        return FastRandom._bulk_multipliers
+
+    def _next_states(self, count: int):
+        import numpy as np
+        m = FastRandom.LCG_MODULUS
+        powers = FastRandom._get_bulk_multipliers()
+        out = np.empty(count, dtype=np.int64)
+        # Both factors are below 2^31, so the product fits in int64
+        state = self.state % m
+        for start in range(0, count, powers.size):
+            block = min(powers.size, count - start)
+            np.multiply(powers[:block], state, out=out[start:start + block])
+            np.remainder(out[start:start + block], m, out=out[start:start + block])
+            state = int(out[start + block - 1])
+        if count > 0:
+            self.state = state
+        return out
+
+    def get_int32_array(self, count: int):
+        import numpy as np
+        return self._next_states(count).astype(np.int32)
+
+    def get_uint32_array(self, count: int):
+        import numpy as np
+        return self._next_states(count).astype(np.uint32)
+
+    def get_float64_array(self, count: int):
+        return self._next_states(count) / float(FastRandom.LCG_MODULUS)
+
+    def get_float32_array(self, count: int):
+        import numpy as np
+        return self.get_float64_array(count).astype(np.float32)
+
+    def get_float64_in_range_array(self, count: int, low: float, high: float):
+        return low + self.get_float64_array(count) * (high - low)
+
+    def get_float32_in_range_array(self, count: int, low: float, high: float):
+        import numpy as np
+        return (low + self.get_float64_array(count) * (high - low)).astype(np.float32)
+
+    def get_int32_in_range_array(self, count: int, low: int, high: int):
+        import numpy as np
+        if low >= high:
+            # Like the scalar version: no draws, and the int64 dtype of the branch below
+            return np.full(count, low, dtype=np.int64)
+        return low + self._next_states(count) // (0xFFFFFFFF // (high - low + 1) + 1)
+
     # Convenience alias methods
     def get_in_range(self, low, high):
         if isinstance(low, int) and isinstance(high, int):
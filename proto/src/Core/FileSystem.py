@@ -1,11 +1,59 @@
+import mmap
 from pathlib import Path
-from Buffer import Buffer
+from typing import Iterator
+
+from Core.Buffer import Buffer
+
+
+class MappedBuffer(Buffer):
+    """
+    Read-only Buffer over a memory-mapped file. `data` is a memoryview of the
+    mapping, so pages are loaded on demand and nothing is copied into Python memory.
+    """
+
+    def __init__(self, filepath: str | Path):
+        super().__init__()
+        self._mmap: mmap.mmap | None = None
+        with Path(filepath).open("rb") as f:
+            self._mmap = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        self.data = memoryview(self._mmap)
+        self.size = len(self._mmap)
+
+    def allocate(self, size: int):
+        raise TypeError("MappedBuffer is read-only and cannot be reallocated")
+
+    def release(self):
+        # Views handed out from `data` must be dropped before the mapping can close
+        mapping = getattr(self, "_mmap", None)
+        if isinstance(self.data, memoryview):
+            self.data.release()
+        self.data = None
+        self.size = 0
+        if mapping is not None:
+            mapping.close()
+            self._mmap = None
+
+    def __enter__(self) -> 'MappedBuffer':
+        return self
+
+    def __exit__(self, *exc):
+        self.release()
+
+    def __del__(self):
+        try:
+            self.release()
+        except BufferError:
+            pass
+
 
 class FileSystem:
+    DEFAULT_CHUNK_SIZE = 1024 * 1024
+
     @staticmethod
-    def read_file_binary(filepath: str | Path) -> Buffer:
+    def read_file_binary(filepath: str | Path, mapped: bool = False) -> Buffer:
         """
         Reads a file in binary mode and returns its contents in a Buffer.
+        With mapped=True the file is memory-mapped instead of read (MappedBuffer).
         Returns an empty Buffer if the file cannot be opened or is empty.
         """
         path = Path(filepath)
@@ -16,7 +64,45 @@ class FileSystem:
         if size == 0:
             return Buffer()  # file is empty
 
+        if mapped:
+            return MappedBuffer(path)
+
         buf = Buffer(size)
-        with path.open("rb") as f:
-            buf.data[:] = f.read(size)
-        return buf
\ No newline at end of file
+        FileSystem.read_file_into(path, buf)
+        return buf
+
+    @staticmethod
+    def read_file_into(filepath: str | Path, buffer: Buffer, offset: int = 0) -> int:
+        """
+        Fills a caller-supplied Buffer from the file starting at `offset` with
+        readinto, without an intermediate bytes object. Returns the bytes read.
+        """
+        if not buffer:
+            return 0
+        view = memoryview(buffer.data)[:buffer.size]
+        total = 0
+        with Path(filepath).open("rb", buffering=0) as f:
+            f.seek(offset)
+            while total < buffer.size:
+                count = f.readinto(view[total:])
+                if not count:
+                    break
+                total += count
+        return total
+
+    @staticmethod
+    def iter_file_chunks(filepath: str | Path, chunk_size: int = DEFAULT_CHUNK_SIZE,
+                         buffer: Buffer | None = None) -> Iterator[memoryview]:
+        """
+        Streams a file as memoryviews over one reused Buffer of `chunk_size`
+        bytes. Each view is only valid until the next chunk is requested.
+        """
+        if buffer is None or buffer.size < chunk_size:
+            buffer = Buffer(chunk_size)
+        view = memoryview(buffer.data)[:chunk_size]
+        with Path(filepath).open("rb", buffering=0) as f:
+            while True:
+                count = f.readinto(view)
+                if not count:
+                    break
+                yield view[:count]
@@ -16,6 +16,39 @@ class Hash:
         hash_ = (hash_ * Hash.FNV_PRIME) & 0xFFFFFFFF
         return hash_
 
+    @staticmethod
+    def generate_fnv_hash_array(names):
+        """
+        generate_fnv_hash for a whole sequence of strings at once, returned as a
+        NumPy uint32 array. Runs one vectorized step per character column, so
+        cost scales with the longest name rather than the total character count.
+        Trailing NUL characters are not supported (NumPy strips them).
+        """
+        import numpy as np
+
+        if isinstance(names, str):
+            # A bare string would become a 0-d array and silently hash nothing
+            raise TypeError("generate_fnv_hash_array expects a sequence of strings; use generate_fnv_hash for one")
+        codes = np.asarray(names, dtype=np.str_)
+        count = codes.shape[0] if codes.ndim else 0
+        hashes = np.full(count, Hash.OFFSET_BASIS, dtype=np.uint64)
+        if count == 0:
+            return hashes.astype(np.uint32)
+
+        width = codes.dtype.itemsize // 4
+        # UTF-32 code units == ord(c), zero padded past each name's end
+        chars = codes.view(np.uint32).reshape(count, width).astype(np.uint64) if width else None
+        lengths = np.char.str_len(codes)
+        prime = np.uint64(Hash.FNV_PRIME)
+        mask = np.uint64(0xFFFFFFFF)
+        for column in range(width):
+            active = lengths > column
+            stepped = ((hashes ^ chars[:, column]) * prime) & mask
+            np.copyto(hashes, stepped, where=active)
+        # final null byte
+        hashes = (hashes * prime) & mask
+        return hashes.astype(np.uint32)
+
     @staticmethod
     def crc32(s: str) -> int:
         """Compute CRC32 of a string."""
@@ -1,5 +1,8 @@
+import zlib
 from typing import Final
 
+from Core.Buffer import Buffer, ScopedBuffer
+
 class Hash:
     # Precompute the CRC32 table at module load
     POLYNOMIAL: Final[int] = 0xEDB88320
@@ -25,17 +28,116 @@ assert len(crc32_table) == 256
 assert crc32_table[1] == 0x77073096
 assert crc32_table[255] == 0x2D02EF8D
 
+def _as_bytes(data) -> bytes | bytearray | memoryview:
+    # Accept anything exposing the buffer protocol, plus Core.Buffer; pooled
+    # storage can be longer than the buffer, so only hash the first `size` bytes
+    if isinstance(data, ScopedBuffer):
+        data = data.buffer
+    if isinstance(data, Buffer):
+        return memoryview(data.data)[:data.size] if data.data is not None else b""
+    return data
+
 class Hash:
+    POLYNOMIAL: Final[int] = Hash.POLYNOMIAL
+
     @staticmethod
     def crc32(data: str) -> int:
-        crc = 0xFFFFFFFF
-        for c in data:
-            crc = crc32_table[(crc ^ ord(c)) & 0xFF] ^ (crc >> 8)
-        return crc ^ 0xFFFFFFFF
+        """CRC32 of the UTF-8 encoding of a string."""
+        return zlib.crc32(data.encode("utf-8")) & 0xFFFFFFFF
+
+    @staticmethod
+    def crc32_bytes(data) -> int:
+        """CRC32 of bytes/bytearray/memoryview/Buffer/ScopedBuffer (zlib, same polynomial as crc32_table)."""
+        return zlib.crc32(_as_bytes(data)) & 0xFFFFFFFF
 
     @staticmethod
-    def crc32_bytes(data: bytes) -> int:
+    def crc32_bytes_reference(data) -> int:
+        """Byte-at-a-time table implementation, kept to validate the fast path."""
         crc = 0xFFFFFFFF
-        for b in data:
+        for b in memoryview(_as_bytes(data)).cast("B"):
             crc = crc32_table[(crc ^ b) & 0xFF] ^ (crc >> 8)
-        return crc ^ 0xFFFFFFFF
\ No newline at end of file
+        return crc ^ 0xFFFFFFFF
+
+    @staticmethod
+    def crc32_combine(crc1: int, crc2: int, len2: int) -> int:
+        """
+        CRC32 of A + B given crc32(A), crc32(B) and len(B), so chunks hashed
+        independently can be merged. Port of zlib's GF(2) matrix method, O(log len2).
+        """
+        if len2 <= 0:
+            return crc1
+
+        def times(matrix, vec):
+            total = 0
+            i = 0
+            while vec:
+                if vec & 1:
+                    total ^= matrix[i]
+                vec >>= 1
+                i += 1
+            return total
+
+        def square(matrix):
+            return [times(matrix, matrix[n]) for n in range(32)]
+
+        # Operator for one zero bit, squared to advance by 2, 4, 8... zero bits
+        odd = [Hash.POLYNOMIAL] + [1 << n for n in range(31)]
+        even = square(odd)   # two zero bits
+        odd = square(even)   # four zero bits
+
+        while True:
+            even = square(odd)
+            if len2 & 1:
+                crc1 = times(even, crc1)
+            len2 >>= 1
+            if len2 == 0:
+                break
+            odd = square(even)
+            if len2 & 1:
+                crc1 = times(odd, crc1)
+            len2 >>= 1
+            if len2 == 0:
+                break
+
+        return (crc1 ^ crc2) & 0xFFFFFFFF
+
+    @staticmethod
+    def crc32_combine_all(parts) -> int:
+        """Combine an ordered iterable of (crc, length) pairs into one CRC32."""
+        crc = 0
+        for part_crc, length in parts:
+            crc = Hash.crc32_combine(crc, part_crc, length)
+        return crc
+
+class CRC32:
+    """Incremental CRC32: feed data with update() and read the running value."""
+
+    def __init__(self, data=None):
+        self.value: int = 0
+        self.length: int = 0
+        if data is not None:
+            self.update(data)
+
+    def update(self, data) -> 'CRC32':
+        data = _as_bytes(data)
+        self.value = zlib.crc32(data, self.value) & 0xFFFFFFFF
+        self.length += memoryview(data).nbytes
+        return self
+
+    def combine(self, other: 'CRC32') -> 'CRC32':
+        """Append another independently computed CRC32 as if its data followed this one."""
+        self.value = Hash.crc32_combine(self.value, other.value, other.length)
+        self.length += other.length
+        return self
+
+    def copy(self) -> 'CRC32':
+        result = CRC32()
+        result.value = self.value
+        result.length = self.length
+        return result
+
+    def __int__(self) -> int:
+        return self.value
+
+    def __repr__(self) -> str:
+        return f"CRC32(0x{self.value:08X}, {self.length} bytes)"
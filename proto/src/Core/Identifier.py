@@ -1,26 +1,103 @@
 from __future__ import annotations
-from typing import Optional
-from Hash import Hash
+import threading
+from collections.abc import Iterable
+from Core.Hash import Hash
+
+class HashCollisionError(ValueError):
+    """Two different strings produced the same Identifier hash."""
 
 class Identifier:
-    def __init__(self, value: Optional[str | int] = None):
+    """
+    Hashed name. String identifiers are interned: Identifier("name") returns
+    the one shared instance for that string, so its FNV hash is computed once
+    and equality between interned identifiers is an identity check. Interning
+    a string whose hash is already taken by a different string raises
+    HashCollisionError instead of silently aliasing the two names.
+    """
+
+    __slots__ = ("hash", "dbg_name")
+
+    _by_name: dict[str, Identifier] = {}
+    _by_hash: dict[int, Identifier] = {}
+    _lock = threading.Lock()
+
+    def __new__(cls, value: str | int | None = None):
+        if isinstance(value, str):
+            # Lock-free fast path for names already interned
+            identifier = Identifier._by_name.get(value)
+            if identifier is not None:
+                return identifier
+            return Identifier._intern(value, Hash.generate_fnv_hash(value))
+
         if value is None:
-            self.hash: int = 0
-            self.dbg_name: str = ""
-        elif isinstance(value, str):
-            self.hash = Hash.generate_fnv_hash(value)
-            self.dbg_name = value
-        elif isinstance(value, int):
-            self.hash = value
-            self.dbg_name = ""
-        else:
-            raise TypeError("Identifier must be initialized with str, int, or None")
-
-    def __eq__(self, other: Identifier) -> bool:
+            return Identifier._create(0, "")
+        if isinstance(value, int):
+            interned = Identifier._by_hash.get(value)
+            return interned if interned is not None else Identifier._create(value, "")
+        raise TypeError("Identifier must be initialized with str, int, or None")
+
+    @staticmethod
+    def _create(hash_: int, name: str) -> Identifier:
+        identifier = object.__new__(Identifier)
+        object.__setattr__(identifier, "hash", hash_)
+        object.__setattr__(identifier, "dbg_name", name)
+        return identifier
+
+    def __setattr__(self, name, value):
+        raise AttributeError("Identifier is immutable")
+
+    def __delattr__(self, name):
+        raise AttributeError("Identifier is immutable")
+
+    def __reduce__(self):
+        # Rebuild through the constructor so unpickled names are re-interned
+        return Identifier, (self.dbg_name if self.dbg_name else self.hash,)
+
+    @staticmethod
+    def _intern(name: str, hash_: int) -> Identifier:
+        with Identifier._lock:
+            identifier = Identifier._by_name.get(name)
+            if identifier is not None:
+                return identifier
+            existing = Identifier._by_hash.get(hash_)
+            if existing is not None:
+                raise HashCollisionError(
+                    f"Identifier hash 0x{hash_:08x} of '{name}' collides with '{existing.dbg_name}'")
+            identifier = Identifier._create(hash_, name)
+            Identifier._by_hash[hash_] = identifier
+            Identifier._by_name[name] = identifier
+            return identifier
+
+    @staticmethod
+    def intern_many(names: Iterable[str]) -> list[Identifier]:
+        """Intern a batch of names, hashing the ones not yet interned with one vectorized pass."""
+        names = list(names)
+        missing = list(dict.fromkeys(name for name in names if name not in Identifier._by_name))
+        if missing:
+            for name, hash_ in zip(missing, Hash.generate_fnv_hash_array(missing).tolist()):
+                Identifier._intern(name, hash_)
+        by_name = Identifier._by_name
+        return [by_name[name] for name in names]
+
+    @staticmethod
+    def find(hash_: int) -> Identifier | None:
+        """Interned identifier with this hash, if any (e.g. to recover a name for logging)."""
+        return Identifier._by_hash.get(hash_)
+
+    @staticmethod
+    def interned_count() -> int:
+        return len(Identifier._by_name)
+
+    def __eq__(self, other: object) -> bool:
+        if self is other:
+            return True
+        if not isinstance(other, Identifier):
+            return NotImplemented
         return self.hash == other.hash
 
-    def __ne__(self, other: Identifier) -> bool:
-        return self.hash != other.hash
+    def __ne__(self, other: object) -> bool:
+        result = self.__eq__(other)
+        return result if result is NotImplemented else not result
 
     def __int__(self) -> int:
         return self.hash
@@ -29,4 +106,7 @@ class Identifier:
         return self.dbg_name
 
     def __hash__(self) -> int:
-        return self.hash
\ No newline at end of file
+        return self.hash
+
+    def __repr__(self) -> str:
+        return f"Identifier('{self.dbg_name}')" if self.dbg_name else f"Identifier(0x{self.hash:08x})"
@@ -0,0 +1,253 @@
+import os
+import random
+import threading
+import time
+from collections import deque
+from typing import Any, Callable, Iterable
+
+from Core.Thread import Thread
+from Debug.Profiler import SAW_PROFILE_THREAD
+
+
+class JobFuture:
+    """Result of a job. Waiting on it from a worker thread runs other jobs meanwhile."""
+
+    __slots__ = ("_system", "_condition", "_done", "_result", "_exception", "_callbacks")
+
+    def __init__(self, system: 'JobSystem | None' = None):
+        self._system = system
+        self._condition = threading.Condition(threading.Lock())
+        self._done = False
+        self._result = None
+        self._exception: BaseException | None = None
+        self._callbacks: list[Callable[['JobFuture'], None]] = []
+
+    def done(self) -> bool:
+        return self._done
+
+    def _finish(self, result=None, exception: BaseException | None = None):
+        with self._condition:
+            if self._done:
+                return
+            self._result = result
+            self._exception = exception
+            self._done = True
+            callbacks, self._callbacks = self._callbacks, []
+            self._condition.notify_all()
+        for callback in callbacks:
+            callback(self)
+
+    def add_done_callback(self, callback: Callable[['JobFuture'], None]):
+        with self._condition:
+            if not self._done:
+                self._callbacks.append(callback)
+                return
+        callback(self)
+
+    def wait(self, timeout: float | None = None) -> bool:
+        if self._done:
+            return True
+        if self._system is not None and self._system.is_worker_thread():
+            # Never block a worker: help drain the queues until the job completes
+            return self._system._help_until(self, timeout)
+        with self._condition:
+            return self._condition.wait_for(lambda: self._done, timeout)
+
+    def result(self, timeout: float | None = None):
+        if not self.wait(timeout):
+            raise TimeoutError("Job did not complete in time")
+        if self._exception is not None:
+            raise self._exception
+        return self._result
+
+    def exception(self) -> BaseException | None:
+        self.wait()
+        return self._exception
+
+    def then(self, func: Callable[[Any], Any]) -> 'JobFuture':
+        """Schedule func(result) once this job succeeds; failures propagate to the returned future."""
+        if self._system is None:
+            raise RuntimeError("Continuations need a JobSystem-owned future")
+        return self._system.submit(lambda: func(self.result()), depends_on=(self,))
+
+
+class _Job:
+    __slots__ = ("func", "args", "kwargs", "future")
+
+    def __init__(self, func, args, kwargs, future: JobFuture):
+        self.func = func
+        self.args = args
+        self.kwargs = kwargs
+        self.future = future
+
+    def run(self):
+        try:
+            result = self.func(*self.args, **self.kwargs)
+        except BaseException as e:
+            self.future._finish(exception=e)
+        else:
+            self.future._finish(result)
+
+
+class JobSystem:
+    """
+    Persistent worker pool with per-worker deques and work stealing. Workers
+    push and pop their own deque LIFO (good locality for jobs that spawn
+    jobs) and steal FIFO from the others; jobs submitted from outside the pool
+    go through a shared injection queue. Jobs can depend on other futures, so
+    "run N tile jobs, then reduce" is one submit per job.
+    """
+
+    _instance: 'JobSystem | None' = None
+    _instance_lock = threading.Lock()
+
+    def __init__(self, num_workers: int | None = None, name: str = "Job Worker"):
+        self.num_workers = num_workers or max(1, (os.cpu_count() or 2) - 1)
+        self._deques: list[deque[_Job]] = [deque() for _ in range(self.num_workers)]
+        self._injector: deque[_Job] = deque()
+        self._condition = threading.Condition(threading.Lock())
+        self._epoch = 0
+        self._shutdown = False
+        self._local = threading.local()
+
+        self._threads = [Thread(f"{name} {i}", daemon=True) for i in range(self.num_workers)]
+        for index, thread in enumerate(self._threads):
+            thread.dispatch(self._worker_loop, index)
+
+    @staticmethod
+    def instance() -> 'JobSystem':
+        """Process-wide job system, created on first use."""
+        with JobSystem._instance_lock:
+            if JobSystem._instance is None:
+                JobSystem._instance = JobSystem()
+            return JobSystem._instance
+
+    def is_worker_thread(self) -> bool:
+        return getattr(self._local, "index", None) is not None
+
+    def submit(self, func: Callable, *args, depends_on: Iterable[JobFuture] = (), **kwargs) -> JobFuture:
+        """Run func(*args, **kwargs) on the pool once every future in depends_on has completed."""
+        future = JobFuture(self)
+        job = _Job(func, args, kwargs, future)
+        dependencies = list(depends_on)
+        if not dependencies:
+            self._schedule(job)
+            return future
+
+        remaining = [len(dependencies)]
+        lock = threading.Lock()
+
+        def on_dependency_done(dependency: JobFuture):
+            with lock:
+                remaining[0] -= 1
+                ready = remaining[0] == 0
+            if ready:
+                failed = next((d._exception for d in dependencies if d._exception is not None), None)
+                if failed is not None:
+                    future._finish(exception=failed)
+                else:
+                    self._schedule(job)
+
+        for dependency in dependencies:
+            dependency.add_done_callback(on_dependency_done)
+        return future
+
+    def when_all(self, futures: Iterable[JobFuture]) -> JobFuture:
+        """Future that completes with the list of results once all futures have."""
+        futures = list(futures)
+        return self.submit(lambda: [f.result() for f in futures], depends_on=futures)
+
+    def parallel_for(self, count: int, body: Callable[[int, int], Any], grain: int | None = None) -> list:
+        """
+        Split range(count) into chunks of `grain` and run body(start, stop) for
+        each on the pool, returning the per-chunk results in order. NumPy
+        kernels inside body release the GIL, so chunks run across cores.
+        """
+        if count <= 0:
+            return []
+        grain = grain or max(1, -(-count // (4 * (self.num_workers + 1))))
+        futures = [self.submit(body, start, min(start + grain, count)) for start in range(0, count, grain)]
+        # The caller works too instead of idling
+        for future in futures:
+            if not future.done() and not self.is_worker_thread():
+                self._help_until(future)
+        return [future.result() for future in futures]
+
+    def shutdown(self, wait: bool = True):
+        with self._condition:
+            self._shutdown = True
+            self._condition.notify_all()
+        if wait:
+            for thread in self._threads:
+                thread.join()
+        with JobSystem._instance_lock:
+            if JobSystem._instance is self:
+                JobSystem._instance = None
+
+    def _schedule(self, job: _Job):
+        index = getattr(self._local, "index", None)
+        if index is not None:
+            self._deques[index].append(job)
+        else:
+            self._injector.append(job)
+        with self._condition:
+            self._epoch += 1
+            self._condition.notify()
+
+    def _find_job(self, index: int | None) -> _Job | None:
+        # deque append/pop/popleft are atomic, so owners and thieves need no lock
+        if index is not None:
+            try:
+                return self._deques[index].pop()
+            except IndexError:
+                pass
+        try:
+            return self._injector.popleft()
+        except IndexError:
+            pass
+        start = random.randrange(self.num_workers)
+        for offset in range(self.num_workers):
+            victim = (start + offset) % self.num_workers
+            if victim == index:
+                continue
+            try:
+                return self._deques[victim].popleft()
+            except IndexError:
+                continue
+        return None
+
+    def _help_until(self, future: JobFuture, timeout: float | None = None) -> bool:
+        """Run queued jobs until future completes; False if timeout expired first (a running job can overshoot it)."""
+        deadline = None if timeout is None else time.monotonic() + timeout
+        index = getattr(self._local, "index", None)
+        while not future.done():
+            wait = 0.001
+            if deadline is not None:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0.0:
+                    return False
+                wait = min(wait, remaining)
+            job = self._find_job(index)
+            if job is not None:
+                job.run()
+            else:
+                with future._condition:
+                    future._condition.wait_for(lambda: future._done, wait)
+        return True
+
+    def _worker_loop(self, index: int):
+        self._local.index = index
+        SAW_PROFILE_THREAD(threading.current_thread().name)
+        while True:
+            with self._condition:
+                epoch = self._epoch
+                if self._shutdown:
+                    return
+            job = self._find_job(index)
+            if job is not None:
+                job.run()
+                continue
+            with self._condition:
+                # Sleep only if nothing was scheduled since the search began
+                if self._epoch == epoch and not self._shutdown:
+                    self._condition.wait()
@@ -0,0 +1,53 @@
+from Core.Timestep import Timestep
+
+class Layer:
+    """
+    Unit of per-frame work owned by the Application. Override the hooks you
+    need; each receives the Timestep of its own clock.
+    """
+
+    def __init__(self, name: str = "Layer"):
+        self.name = name
+
+    def on_attach(self):
+        pass
+
+    def on_detach(self):
+        pass
+
+    def on_update(self, ts: Timestep):
+        """Fixed-rate simulation step; ts is always the fixed timestep."""
+        pass
+
+    def on_render(self, ts: Timestep):
+        """Render/present tick; ts is the time since the previous render tick."""
+        pass
+
+    def on_io(self, ts: Timestep):
+        """I/O tick (transfers, logging, telemetry); ts is the time since the previous I/O tick."""
+        pass
+
+
+class LayerStack:
+    def __init__(self):
+        self._layers: list[Layer] = []
+
+    def push_layer(self, layer: Layer):
+        self._layers.append(layer)
+        layer.on_attach()
+
+    def pop_layer(self, layer: Layer):
+        if layer in self._layers:
+            self._layers.remove(layer)
+            layer.on_detach()
+
+    def clear(self):
+        for layer in reversed(self._layers):
+            layer.on_detach()
+        self._layers.clear()
+
+    def __iter__(self):
+        return iter(self._layers)
+
+    def __len__(self) -> int:
+        return len(self._layers)
@@ -1,14 +1,22 @@
+import atexit
 import logging
+import queue
 import sys
 import os
+import threading
+import time
 from enum import Enum, auto
 
-# Logs folder relative to project root
+# Logs folder relative to project root; created on the first write, not at import
 PROJECT_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "..", ".."))
 LOG_FOLDER_PATH = os.path.join(PROJECT_ROOT, "logs")
-os.makedirs(LOG_FOLDER_PATH, exist_ok=True)
 LOG_FILE_PATH = os.path.join(LOG_FOLDER_PATH, "Log.log")
 
+def log_file_path() -> str:
+    """Log file used by Log.init(): SAW_LOG_DIR/Log.log if that is set, else LOG_FILE_PATH."""
+    folder = os.getenv("SAW_LOG_DIR")
+    return os.path.join(os.path.abspath(folder), "Log.log") if folder else LOG_FILE_PATH
+
 class LoggerType(Enum):
     CORE = auto()
     CLIENT = auto()
@@ -35,6 +43,10 @@ COLOR_MAP = {
 
 RESET = "\033[0m"
 
+# Precomputed per-levelno lookups so formatting never scans LogLevel
+LEVEL_NAMES = {lvl.value: lvl.name for lvl in LogLevel}
+LEVEL_COLORS = {lvl.value: COLOR_MAP[lvl] for lvl in LogLevel}
+
 def trace(self, message, *args, **kwargs):
     if self.isEnabledFor(TRACE_LEVEL):
         self._log(TRACE_LEVEL, message, args, **kwargs)
@@ -50,9 +62,8 @@ class ColorFormatter(logging.Formatter):
 
     def format(self, record):
         logger_type = "CORE" if record.name == "SAW" else "CLIENT"
-        level = next((lvl for lvl in LogLevel if lvl.value == record.levelno), None)
-        level_name = level.name if level else record.levelname
-        color = COLOR_MAP.get(level, RESET)
+        level_name = LEVEL_NAMES.get(record.levelno, record.levelname)
+        color = LEVEL_COLORS.get(record.levelno, RESET)
         formatted = self.pattern.format(
             time=self.formatTime(record, "%H:%M:%S"),
             logger_type=logger_type,
@@ -62,46 +73,238 @@ class ColorFormatter(logging.Formatter):
         )
         return f"{color}{formatted}{RESET}"
 
+class LazyFileHandler(logging.FileHandler):
+    """FileHandler that creates its directory and opens the file on the first record."""
+
+    def __init__(self, filename, mode="a", encoding=None):
+        super().__init__(filename, mode, encoding, delay=True)
+
+    def _open(self):
+        os.makedirs(os.path.dirname(self.baseFilename), exist_ok=True)
+        return super()._open()
+
+class BatchingHandlerMixin:
+    """Writes without flushing per record; the async listener flushes once per batch."""
+
+    def emit(self, record):
+        try:
+            msg = self.format(record)
+            self.stream.write(msg + self.terminator)
+        except RecursionError:
+            raise
+        except Exception:
+            self.handleError(record)
+
+class BatchStreamHandler(BatchingHandlerMixin, logging.StreamHandler):
+    pass
+
+class BatchFileHandler(BatchingHandlerMixin, LazyFileHandler):
+    def emit(self, record):
+        if self.stream is None:
+            self.stream = self._open()
+        super().emit(record)
+
+class OverflowPolicy(Enum):
+    DROP = auto()   # discard the record when the queue is full (never stalls the caller)
+    BLOCK = auto()  # wait for the background thread to make room
+
+class AsyncQueueHandler(logging.Handler):
+    """
+    Hot-path handler: enqueues the unformatted record. Message arguments are
+    only merged (record.getMessage) on the background thread, so they should
+    not be mutated after the log call.
+    """
+
+    def __init__(self, record_queue: queue.Queue, policy: OverflowPolicy):
+        super().__init__()
+        self.queue = record_queue
+        self.policy = policy
+        self.dropped = 0
+
+    def emit(self, record):
+        self.put(record)
+
+    def enqueue(self, name: str, level: int, msg, args: tuple):
+        # Fast path used by the SAW_* functions: skips LogRecord construction
+        # and caller lookup; the worker builds the record from this tuple
+        self.put((name, level, msg, args, time.time(), threading.current_thread().name))
+
+    def put(self, item):
+        if self.policy == OverflowPolicy.BLOCK:
+            self.queue.put(item)
+            return
+        try:
+            self.queue.put_nowait(item)
+        except queue.Full:
+            self.dropped += 1
+
+    # logging.Handler.handle takes a lock per record; a Queue is already thread-safe
+    def handle(self, record):
+        if self.filter(record):
+            self.emit(record)
+        return True
+
+class AsyncLogWorker:
+    """Background thread that drains the record queue and writes in batches."""
+
+    _STOP = object()
+
+    def __init__(self, record_queue: queue.Queue, handlers: list[logging.Handler], batch_size: int = 256):
+        self.queue = record_queue
+        self.handlers = handlers
+        self.batch_size = batch_size
+        self._thread = threading.Thread(target=self._run, name="SAW-Log", daemon=True)
+
+    def start(self):
+        self._thread.start()
+
+    def stop(self):
+        if self._thread.is_alive():
+            self.queue.put(AsyncLogWorker._STOP)
+            self._thread.join()
+
+    @staticmethod
+    def _make_record(item: tuple) -> logging.LogRecord:
+        name, level, msg, args, created, thread_name = item
+        record = logging.LogRecord(name, level, "", 0, msg, args or None, None)
+        record.created = created
+        record.msecs = (created - int(created)) * 1000.0
+        record.threadName = thread_name
+        return record
+
+    def _run(self):
+        running = True
+        while running:
+            batch = [self.queue.get()]
+            while len(batch) < self.batch_size:
+                try:
+                    batch.append(self.queue.get_nowait())
+                except queue.Empty:
+                    break
+
+            for record in batch:
+                if record is AsyncLogWorker._STOP:
+                    running = False
+                    continue
+                if isinstance(record, tuple):
+                    record = AsyncLogWorker._make_record(record)
+                for handler in self.handlers:
+                    if record.levelno >= handler.level:
+                        handler.handle(record)
+
+            for handler in self.handlers:
+                handler.flush()
+
 class Log:
     core_logger: logging.Logger = None
     client_logger: logging.Logger = None
 
+    _handlers: list[logging.Handler] = []
+    _queue_handler: AsyncQueueHandler = None
+    _worker: AsyncLogWorker = None
+
     @staticmethod
-    def init():
+    def init(asynchronous: bool = False, queue_size: int = 65536,
+             overflow: OverflowPolicy = OverflowPolicy.BLOCK):
+        """
+        Set up the SAW (core) and APP (client) loggers. Calling init again
+        replaces the previous handlers instead of stacking them. With
+        asynchronous=True, log calls only enqueue the record onto a bounded
+        queue and a background thread formats and writes them in batches.
+        """
+        Log.shutdown()
         ColorFormatter.set_pattern("[{time}] [{logger_type}] [{level}] [{logger_name}]: {message}")
-        Log.core_logger = Log.create_logger("SAW")
-        Log.client_logger = Log.create_logger("APP")
+
+        Log._handlers = Log.create_handlers(batched=asynchronous)
+        if asynchronous:
+            record_queue = queue.Queue(maxsize=queue_size)
+            Log._queue_handler = AsyncQueueHandler(record_queue, overflow)
+            Log._worker = AsyncLogWorker(record_queue, Log._handlers)
+            Log._worker.start()
+            logger_handlers = [Log._queue_handler]
+        else:
+            logger_handlers = Log._handlers
+
+        Log.core_logger = Log.create_logger("SAW", logger_handlers)
+        Log.client_logger = Log.create_logger("APP", logger_handlers)
 
     @staticmethod
-    def create_logger(name: str) -> logging.Logger:
-        logger = logging.getLogger(name)
-        logger.setLevel(TRACE_LEVEL)  # Include TRACE
+    def shutdown():
+        """Drain and stop the background writer (if any) and close all handlers."""
+        if Log._worker is not None:
+            Log._worker.stop()
+            Log._worker = None
+        Log._queue_handler = None
+        for handler in Log._handlers:
+            handler.close()
+        Log._handlers = []
+
+    @staticmethod
+    def write(logger: logging.Logger, level: int, msg, args: tuple):
+        handler = Log._queue_handler
+        if handler is None:
+            logger.log(level, msg, *args)
+        elif logger.isEnabledFor(level):
+            handler.enqueue(logger.name, level, msg, args)
 
-        console_handler = logging.StreamHandler(sys.stdout)
+    @staticmethod
+    def core() -> logging.Logger:
+        """Core logger, initializing logging with defaults if nobody has yet."""
+        if Log.core_logger is None:
+            Log.init()
+        return Log.core_logger
+
+    @staticmethod
+    def client() -> logging.Logger:
+        if Log.client_logger is None:
+            Log.init()
+        return Log.client_logger
+
+    @staticmethod
+    def dropped_records() -> int:
+        return Log._queue_handler.dropped if Log._queue_handler is not None else 0
+
+    @staticmethod
+    def create_handlers(batched: bool = False) -> list[logging.Handler]:
+        console_handler = (BatchStreamHandler if batched else logging.StreamHandler)(sys.stdout)
         console_handler.setFormatter(ColorFormatter())
-        logger.addHandler(console_handler)
 
-        file_handler = logging.FileHandler(LOG_FILE_PATH)
+        file_handler = (BatchFileHandler if batched else LazyFileHandler)(log_file_path())
         file_formatter = logging.Formatter(
             "[{asctime}] [{levelname}] [{name}]: {message}", 
             style='{', 
             datefmt="%H:%M:%S"
         )
         file_handler.setFormatter(file_formatter)
-        logger.addHandler(file_handler)
+        return [console_handler, file_handler]
+
+    @staticmethod
+    def create_logger(name: str, handlers: list[logging.Handler] | None = None) -> logging.Logger:
+        logger = logging.getLogger(name)
+        logger.setLevel(TRACE_LEVEL)  # Include TRACE
+        logger.propagate = False
+
+        for handler in list(logger.handlers):
+            logger.removeHandler(handler)
+        for handler in handlers if handlers is not None else Log.create_handlers():
+            logger.addHandler(handler)
 
         return logger
 
-def SAW_DT_TRACE(msg): Log.core_logger.trace(msg)
-def SAW_DT_DEBUG(msg): Log.core_logger.debug(msg)
-def SAW_DT_INFO(msg): Log.core_logger.info(msg)
-def SAW_DT_WARN(msg): Log.core_logger.warning(msg)
-def SAW_DT_ERROR(msg): Log.core_logger.error(msg)
-def SAW_DT_FATAL(msg): Log.core_logger.critical(msg)
-
-def SAW_TRACE(msg): Log.client_logger.trace(msg)
-def SAW_DEBUG(msg): Log.client_logger.debug(msg)
-def SAW_INFO(msg): Log.client_logger.info(msg)
-def SAW_WARN(msg): Log.client_logger.warning(msg)
-def SAW_ERROR(msg): Log.client_logger.error(msg)
-def SAW_FATAL(msg): Log.client_logger.critical(msg)
\ No newline at end of file
+atexit.register(Log.shutdown)
+
+# Extra positional arguments are %-merged into msg lazily, only if the record is emitted.
+# Logging initializes itself on the first message if Log.init() wasn't called.
+def SAW_DT_TRACE(msg, *args): Log.write(Log.core_logger or Log.core(), TRACE_LEVEL, msg, args)
+def SAW_DT_DEBUG(msg, *args): Log.write(Log.core_logger or Log.core(), logging.DEBUG, msg, args)
+def SAW_DT_INFO(msg, *args): Log.write(Log.core_logger or Log.core(), logging.INFO, msg, args)
+def SAW_DT_WARN(msg, *args): Log.write(Log.core_logger or Log.core(), logging.WARNING, msg, args)
+def SAW_DT_ERROR(msg, *args): Log.write(Log.core_logger or Log.core(), logging.ERROR, msg, args)
+def SAW_DT_FATAL(msg, *args): Log.write(Log.core_logger or Log.core(), logging.CRITICAL, msg, args)
+
+def SAW_TRACE(msg, *args): Log.write(Log.client_logger or Log.client(), TRACE_LEVEL, msg, args)
+def SAW_DEBUG(msg, *args): Log.write(Log.client_logger or Log.client(), logging.DEBUG, msg, args)
+def SAW_INFO(msg, *args): Log.write(Log.client_logger or Log.client(), logging.INFO, msg, args)
+def SAW_WARN(msg, *args): Log.write(Log.client_logger or Log.client(), logging.WARNING, msg, args)
+def SAW_ERROR(msg, *args): Log.write(Log.client_logger or Log.client(), logging.ERROR, msg, args)
+def SAW_FATAL(msg, *args): Log.write(Log.client_logger or Log.client(), logging.CRITICAL, msg, args)
\ No newline at end of file
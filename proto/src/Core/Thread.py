@@ -2,12 +2,13 @@
 import threading
 
 class Thread:
-    def __init__(self, name: str):
+    def __init__(self, name: str, daemon: bool = False):
         self.name = name
+        self.daemon = daemon
         self.thread = None
 
     def dispatch(self, func, *args, **kwargs):
-        self.thread = threading.Thread(target=func, args=args, kwargs=kwargs, name=self.name)
+        self.thread = threading.Thread(target=func, args=args, kwargs=kwargs, name=self.name, daemon=self.daemon)
         self.thread.start()
 
     def set_name(self, name: str):
@@ -24,18 +25,38 @@ class Thread:
 
 
 class ThreadSignal:
+    """
+    Manual-reset signals stay set until reset(). Auto-reset signals stay set
+    until exactly one waiter consumes them, so a signal raised before the
+    waiter arrives is not lost (setting and immediately clearing an Event
+    would drop it).
+    """
+
     def __init__(self, name: str, manual_reset: bool = False):
-        self.event = threading.Event()
         self.name = name
         self.manual_reset = manual_reset
+        self._condition = threading.Condition(threading.Lock())
+        self._signaled = False
 
-    def wait(self):
-        self.event.wait()
+    def wait(self, timeout: float | None = None) -> bool:
+        with self._condition:
+            if not self._condition.wait_for(lambda: self._signaled, timeout):
+                return False
+            if not self.manual_reset:
+                self._signaled = False
+            return True
 
     def signal(self):
-        self.event.set()
-        if not self.manual_reset:
-            self.event.clear()
+        with self._condition:
+            self._signaled = True
+            if self.manual_reset:
+                self._condition.notify_all()
+            else:
+                self._condition.notify()
 
     def reset(self):
-        self.event.clear()
\ No newline at end of file
+        with self._condition:
+            self._signaled = False
+
+    def is_set(self) -> bool:
+        return self._signaled
@@ -1,6 +1,9 @@
+import sys
 import time
 
 class Timer:
+    __slots__ = ("_start",)
+
     def __init__(self):
         self.reset()
 
@@ -21,4 +24,16 @@ class Timer:
         return self.elapsed() * 1000.0
 
     def __repr__(self) -> str:
-        return f"Timer(elapsed={self.elapsed():.6f}s)"
\ No newline at end of file
+        return f"Timer(elapsed={self.elapsed():.6f}s)"
+
+# Sleeps coarsely until `margin` before the deadline, then yields until it is reached.
+# time.sleep alone overshoots by up to a scheduler quantum (~1-15 ms depending on the OS).
+SLEEP_MARGIN = 0.002 if sys.platform == "win32" else 0.0005
+
+def sleep_until(deadline: float, margin: float = SLEEP_MARGIN):
+    """Sleep until time.perf_counter() reaches `deadline`."""
+    remaining = deadline - time.perf_counter()
+    if remaining > margin:
+        time.sleep(remaining - margin)
+    while time.perf_counter() < deadline:
+        time.sleep(0)
@@ -1,6 +1,17 @@
 class Timestep:
+    __slots__ = ("time",)
+
     def __init__(self, time: float = 0.0):
-        self.time = float(time)
+        object.__setattr__(self, "time", float(time))
+
+    def __setattr__(self, name, value):
+        raise AttributeError("Timestep is immutable")
+
+    def __delattr__(self, name):
+        raise AttributeError("Timestep is immutable")
+
+    def __reduce__(self):
+        return Timestep, (self.time,)
 
     def __float__(self) -> float:
         return self.time
@@ -1,18 +1,42 @@
+import os
 import random
 
 class UUID:
+    """Immutable 32- or 64-bit random identifier."""
+
+    __slots__ = ("value", "bits")
+
     def __init__(self, value: int = None, bits: int = 64):
         if bits not in (32, 64):
             raise ValueError("UUID must be 32 or 64 bits")
-        self.bits = bits
         mask = (1 << bits) - 1
 
         if value is None:
             # Random number in range
-            self.value = random.getrandbits(bits)
-        else:
-            # Force into correct bit size
-            self.value = value & mask
+            value = random.getrandbits(bits)
+        # Force into correct bit size
+        object.__setattr__(self, "value", value & mask)
+        object.__setattr__(self, "bits", bits)
+
+    def __setattr__(self, name, value):
+        raise AttributeError("UUID is immutable")
+
+    def __delattr__(self, name):
+        raise AttributeError("UUID is immutable")
+
+    def __reduce__(self):
+        # Slots plus the raising __setattr__ defeat the default pickle/copy protocol
+        return UUID, (self.value, self.bits)
+
+    @staticmethod
+    def generate_array(count: int, bits: int = 64):
+        """`count` random UUID values as a NumPy uint64 (or uint32) array, from one OS entropy read."""
+        import numpy as np
+
+        if bits not in (32, 64):
+            raise ValueError("UUID must be 32 or 64 bits")
+        dtype = np.uint64 if bits == 64 else np.uint32
+        return np.frombuffer(os.urandom(count * (bits // 8)), dtype=dtype).copy()
 
     def __int__(self) -> int:
         return self.value
@@ -25,4 +49,183 @@ class UUID:
         return hash((self.value, self.bits))
 
     def __repr__(self) -> str:
-        return f"UUID({self.value}, {self.bits}-bit)"
\ No newline at end of file
+        return f"UUID({self.value}, {self.bits}-bit)"
+
+
+class UUIDRegistry:
+    """
+    Maps UUID values to fixed-size records without per-item objects. Keys and
+    records live in parallel NumPy arrays in insertion order (the row number),
+    and lookups binary-search a sorted copy of the keys. Batches from add_many
+    are merged into it directly; single add() calls are buffered and merged
+    with one sort on the next lookup, so registering n items one at a time
+    stays O(n log n). Per item this costs the key, a row index and the record
+    itself.
+    """
+
+    def __init__(self, record_dtype, capacity: int = 1024, bits: int = 64):
+        import numpy as np
+
+        if bits not in (32, 64):
+            raise ValueError("UUID must be 32 or 64 bits")
+        self.bits = bits
+        self._key_dtype = np.dtype(np.uint64 if bits == 64 else np.uint32)
+        self._keys = np.empty(capacity, dtype=self._key_dtype)
+        self._records = np.zeros(capacity, dtype=record_dtype)
+        self._count = 0
+        self._sorted_keys = np.empty(0, dtype=self._key_dtype)
+        self._sorted_rows = np.empty(0, dtype=np.uint32)
+        self._pending: dict[int, int] = {}  # key -> row for add() calls not yet in the sorted index
+
+    def __len__(self) -> int:
+        return self._count
+
+    @property
+    def keys(self):
+        return self._keys[:self._count]
+
+    @property
+    def records(self):
+        """Records in row order; a view, so fields can be updated in place."""
+        return self._records[:self._count]
+
+    def nbytes(self) -> int:
+        return (self._keys.nbytes + self._records.nbytes
+                + self._sorted_keys.nbytes + self._sorted_rows.nbytes)
+
+    def _reserve(self, count: int):
+        import numpy as np
+
+        capacity = len(self._keys)
+        if count <= capacity:
+            return
+        capacity = max(capacity, 1)
+        while capacity < count:
+            capacity *= 2
+        keys = np.empty(capacity, dtype=self._key_dtype)
+        keys[:self._count] = self._keys[:self._count]
+        records = np.zeros(capacity, dtype=self._records.dtype)
+        records[:self._count] = self._records[:self._count]
+        self._keys, self._records = keys, records
+
+    def _as_key(self, uuid) -> int:
+        key = uuid.value if isinstance(uuid, UUID) else int(uuid)
+        if key < 0 or key >> self.bits:
+            raise ValueError(f"UUID {key} does not fit in {self.bits} bits")
+        return key
+
+    def _as_keys(self, uuids):
+        # Validate before converting so NumPy neither wraps nor overflows deep in the index code
+        import numpy as np
+
+        values = np.asarray(uuids).ravel()
+        if values.size and values.dtype != self._key_dtype:
+            if values.dtype.kind not in "iuO":
+                raise ValueError("UUID values must be integers")
+            if int(values.min()) < 0 or int(values.max()) >> self.bits:
+                raise ValueError(f"UUID values must fit in {self.bits} bits")
+        return values.astype(self._key_dtype)
+
+    def _indexed(self, key: int) -> bool:
+        import numpy as np
+
+        position = int(np.searchsorted(self._sorted_keys, key))
+        return position < len(self._sorted_keys) and int(self._sorted_keys[position]) == key
+
+    def _merge_pending(self):
+        # Fold buffered add() rows into the sorted index with one sort and one insert
+        import numpy as np
+
+        if not self._pending:
+            return
+        start = self._count - len(self._pending)
+        keys = self._keys[start:self._count]
+        order = np.argsort(keys)
+        new_keys = keys[order]
+        positions = np.searchsorted(self._sorted_keys, new_keys)
+        self._sorted_keys = np.insert(self._sorted_keys, positions, new_keys)
+        self._sorted_rows = np.insert(self._sorted_rows, positions, (order + start).astype(np.uint32))
+        self._pending.clear()
+
+    def add(self, uuid, record=None) -> int:
+        """Register one UUID (UUID or int) and return its row."""
+        key = self._as_key(uuid)
+        if key in self._pending or self._indexed(key):
+            raise ValueError("UUID already registered")
+        row = self._count
+        self._reserve(row + 1)
+        self._keys[row] = key
+        if record is not None:
+            self._records[row] = record
+        self._count = row + 1
+        self._pending[key] = row
+        return row
+
+    def add_many(self, uuids, records=None):
+        """Register an array of UUID values (and optionally their records); returns their rows."""
+        import numpy as np
+
+        self._merge_pending()
+        uuids = self._as_keys(uuids)
+        order = np.argsort(uuids)
+        new_keys = uuids[order]
+        if len(new_keys) > 1 and not (new_keys[1:] != new_keys[:-1]).all():
+            raise ValueError("UUID already registered")
+        positions = np.searchsorted(self._sorted_keys, new_keys)
+        clipped = np.minimum(positions, len(self._sorted_keys) - 1)
+        if len(self._sorted_keys) and (self._sorted_keys[clipped] == new_keys).any():
+            raise ValueError("UUID already registered")
+
+        start = self._count
+        stop = start + len(uuids)
+        self._reserve(stop)
+        self._keys[start:stop] = uuids
+        if records is not None:
+            self._records[start:stop] = records
+        self._count = stop
+
+        # Merge the sorted batch into the index
+        new_rows = (order + start).astype(np.uint32)
+        self._sorted_keys = np.insert(self._sorted_keys, positions, new_keys)
+        self._sorted_rows = np.insert(self._sorted_rows, positions, new_rows)
+        return np.arange(start, stop)
+
+    def find_rows(self, uuids):
+        """Rows for an array of UUID values, -1 where not registered."""
+        import numpy as np
+
+        self._merge_pending()
+        uuids = self._as_keys(uuids)
+        rows = np.full(len(uuids), -1, dtype=np.int64)
+        if len(self._sorted_keys) == 0:
+            return rows
+        positions = np.searchsorted(self._sorted_keys, uuids)
+        positions = np.minimum(positions, len(self._sorted_keys) - 1)
+        found = self._sorted_keys[positions] == uuids
+        rows[found] = self._sorted_rows[positions[found]]
+        return rows
+
+    def find_row(self, uuid) -> int:
+        import numpy as np
+
+        self._merge_pending()
+        key = self._as_key(uuid)
+        position = int(np.searchsorted(self._sorted_keys, key))
+        if position < len(self._sorted_keys) and int(self._sorted_keys[position]) == key:
+            return int(self._sorted_rows[position])
+        return -1
+
+    def __contains__(self, uuid) -> bool:
+        return self.find_row(uuid) >= 0
+
+    def get(self, uuid):
+        row = self.find_row(uuid)
+        if row < 0:
+            raise KeyError(uuid)
+        return self._records[row]
+
+    def get_many(self, uuids):
+        rows = self.find_rows(uuids)
+        if (rows < 0).any():
+            raise KeyError("UUID not registered")
+        return self._records[rows]
@@ -1,10 +1,9 @@
-import platform
+import os
+import sys
 
 SAW_VERSION = "2025.0.1"
 
-# Build Configuration
-import os
-
+# Build Configuration (defaults to Debug when no SAW_* build variable is set)
 if os.getenv("SAW_DEBUG"):
     SAW_BUILD_CONFIG_NAME = "Debug"
 elif os.getenv("SAW_RELEASE"):
@@ -12,13 +11,12 @@ elif os.getenv("SAW_RELEASE"):
 elif os.getenv("SAW_DIST"):
     SAW_BUILD_CONFIG_NAME = "Dist"
 else:
-    raise RuntimeError("Undefined build configuration")
+    SAW_BUILD_CONFIG_NAME = "Debug"
 
 
-system_platform = platform.system()
-if system_platform == "Windows":
+if sys.platform == "win32":
     SAW_BUILD_PLATFORM_NAME = "Windows x64"
-elif system_platform == "Linux":
+elif sys.platform.startswith("linux"):
     SAW_BUILD_PLATFORM_NAME = "Linux"
 else:
     SAW_BUILD_PLATFORM_NAME = "Unknown"
@@ -0,0 +1,17 @@
+# Submodules are imported on first attribute access (`import Core; Core.Hash.Hash`),
+# so tools that only need a couple of them don't pay for the rest.
+_SUBMODULES = frozenset((
+    "Application", "Base", "Buffer", "DataTransfer", "Delegate", "EntryPoint", "FastRandom",
+    "FileSystem", "Hash", "HashCRC32", "Identifier", "JobSystem", "Layer", "Log", "Thread",
+    "Timer", "Timestep", "UUID", "Version",
+))
+
+def __getattr__(name: str):
+    if name in _SUBMODULES:
+        import importlib
+        # import_module binds the submodule as an attribute of this package
+        return importlib.import_module(f"{__name__}.{name}")
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+def __dir__():
+    return sorted(set(globals()) | _SUBMODULES)
@@ -0,0 +1,324 @@
+import argparse
+import atexit
+import ctypes
+import gc
+import importlib.util
+import json
+import os
+import platform
+import sys
+import tempfile
+from typing import Callable
+
+from Core.Timer import Timer
+
+PROJECT_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "..", ".."))
+SIMULATIONS_DIR = os.path.join(PROJECT_ROOT, "simulations")
+
+
+class BenchmarkResult:
+    def __init__(self, name: str, samples: list[float], number: int):
+        self.name = name
+        self.number = number  # calls per sample
+        self.samples = sorted(samples)  # seconds per call
+
+    def percentile(self, q: float) -> float:
+        # Linear interpolation between closest ranks
+        position = (len(self.samples) - 1) * q / 100.0
+        lower = int(position)
+        upper = min(lower + 1, len(self.samples) - 1)
+        return self.samples[lower] + (self.samples[upper] - self.samples[lower]) * (position - lower)
+
+    @property
+    def mean(self) -> float:
+        return sum(self.samples) / len(self.samples)
+
+    def to_dict(self) -> dict:
+        return {"number": self.number, "repeat": len(self.samples), "min": self.samples[0],
+                "mean": self.mean, "p50": self.percentile(50), "p90": self.percentile(90),
+                "p99": self.percentile(99), "max": self.samples[-1]}
+
+
+def _format_time(seconds: float) -> str:
+    for unit, scale in (("s", 1.0), ("ms", 1e-3), ("us", 1e-6)):
+        if seconds >= scale:
+            return f"{seconds / scale:8.3f} {unit}"
+    return f"{seconds / 1e-9:8.1f} ns"
+
+
+class BenchmarkSuite:
+    """
+    Registry of micro-benchmarks. Each entry is a setup function returning the
+    callable to time; setup cost is excluded. run() warms up, calibrates the
+    number of calls per sample to at least `min_sample_time`, and records
+    `repeat` samples with Core.Timer.
+    """
+
+    def __init__(self):
+        self.benchmarks: dict[str, Callable[[], Callable[[], object]]] = {}
+
+    def register(self, name: str):
+        def decorator(setup):
+            self.benchmarks[name] = setup
+            return setup
+        return decorator
+
+    @staticmethod
+    def measure(func: Callable[[], object], repeat: int = 20, warmup: int = 3,
+                min_sample_time: float = 0.01) -> tuple[list[float], int]:
+        for _ in range(warmup):
+            func()
+
+        timer = Timer()
+        number = 1
+        while True:
+            timer.reset()
+            for _ in range(number):
+                func()
+            if timer.elapsed() >= min_sample_time or number >= 1 << 20:
+                break
+            number *= 2
+
+        samples = []
+        gc_was_enabled = gc.isenabled()
+        gc.disable()
+        try:
+            for _ in range(repeat):
+                timer.reset()
+                for _ in range(number):
+                    func()
+                samples.append(timer.elapsed() / number)
+        finally:
+            if gc_was_enabled:
+                gc.enable()
+        return samples, number
+
+    def run(self, pattern: str | None = None, repeat: int = 20, warmup: int = 3,
+            min_sample_time: float = 0.01, verbose: bool = True) -> dict[str, BenchmarkResult]:
+        results = {}
+        for name, setup in self.benchmarks.items():
+            if pattern and pattern not in name:
+                continue
+            try:
+                func = setup()
+            except ImportError as e:
+                if verbose:
+                    print(f"{name:40s} skipped ({e})")
+                continue
+            samples, number = BenchmarkSuite.measure(func, repeat, warmup, min_sample_time)
+            result = BenchmarkResult(name, samples, number)
+            results[name] = result
+            if verbose:
+                print(f"{name:40s} p50 {_format_time(result.percentile(50))}  "
+                      f"p90 {_format_time(result.percentile(90))}  p99 {_format_time(result.percentile(99))}  "
+                      f"(x{number})")
+        return results
+
+
+def save_baseline(results: dict[str, BenchmarkResult], filepath: str):
+    document = {
+        "machine": {"python": sys.version.split()[0], "platform": platform.platform(),
+                    "processor": platform.processor() or platform.machine()},
+        "results": {name: result.to_dict() for name, result in results.items()},
+    }
+    os.makedirs(os.path.dirname(os.path.abspath(filepath)), exist_ok=True)
+    with open(filepath, "w", encoding="utf-8") as f:
+        json.dump(document, f, indent=2)
+
+
+def load_baseline(filepath: str) -> dict[str, dict]:
+    with open(filepath, "r", encoding="utf-8") as f:
+        return json.load(f)["results"]
+
+
+def compare(baseline: dict[str, dict], current: dict[str, dict], threshold: float = 0.10,
+            metric: str = "p50") -> list[str]:
+    """Print a comparison table and return the names that regressed by more than `threshold`."""
+    regressions = []
+    for name in sorted(set(baseline) | set(current)):
+        if name not in baseline or name not in current:
+            print(f"{name:40s} {'only in current' if name in current else 'only in baseline'}")
+            continue
+        before, after = baseline[name][metric], current[name][metric]
+        change = (after - before) / before if before > 0.0 else 0.0
+        status = "REGRESSION" if change > threshold else ("improved" if change < -threshold else "")
+        if status == "REGRESSION":
+            regressions.append(name)
+        print(f"{name:40s} {_format_time(before)} -> {_format_time(after)}  {change * 100.0:+7.1f}%  {status}")
+    return regressions
+
+
+# Core and simulation hot paths
+
+suite = BenchmarkSuite()
+
+
+def _load_rayleigh_saw():
+    loader_path = os.path.join(SIMULATIONS_DIR, "SimulationLoader.py")
+    spec = importlib.util.spec_from_file_location("SimulationLoader", loader_path)
+    if spec is None or not os.path.isfile(loader_path):
+        raise ImportError("simulations/ not found")
+    loader = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(loader)
+    return loader.LoadSimulation("Rayleigh-SAW")
+
+
+def _register_propagate_wave(size: int, mode_name: str):
+    @suite.register(f"PropagateWave[{mode_name}] {size}x{size}")
+    def setup():
+        saw = _load_rayleigh_saw()
+        context = saw.SimulationContext()
+        context.numPointsX = context.numPointsY = size
+        mode = getattr(saw.PropagationMode, mode_name)
+        clock = [0.0]
+
+        def run():
+            clock[0] += 1.0e-6
+            saw.PropagateWave(context, clock[0], saw.WaveType.CounterPropagating, mode)
+        return run
+
+
+for _size in (20, 150, 500):
+    for _mode in ("Vectorized", "Cached"):
+        _register_propagate_wave(_size, _mode)
+_register_propagate_wave(20, "Scalar")
+_register_propagate_wave(150, "Scalar")
+
+
+@suite.register("HashCRC32.crc32_bytes 1MiB")
+def _setup_crc32():
+    from Core.HashCRC32 import Hash
+    data = os.urandom(1 << 20)
+    return lambda: Hash.crc32_bytes(data)
+
+
+@suite.register("Hash.generate_fnv_hash 32 chars")
+def _setup_fnv():
+    from Core.Hash import Hash
+    name = "SimulationContext.amplitude.x32"
+    return lambda: Hash.generate_fnv_hash(name)
+
+
+@suite.register("FastRandom.get_int32")
+def _setup_fast_random():
+    from Core.FastRandom import FastRandom
+    generator = FastRandom()
+    return generator.get_int32
+
+
+@suite.register("FastRandom.get_int32_array 1M")
+def _setup_fast_random_bulk():
+    from Core.FastRandom import FastRandom
+    generator = FastRandom()
+    return lambda: generator.get_int32_array(1 << 20)
+
+
+@suite.register("Buffer.as_type c_float 64KiB")
+def _setup_as_type():
+    from Core.Buffer import Buffer
+    buffer = Buffer(64 * 1024)
+    return lambda: buffer.as_type(ctypes.c_float)
+
+
+@suite.register("Buffer.view c_float 64KiB")
+def _setup_view():
+    from Core.Buffer import Buffer
+    buffer = Buffer(64 * 1024)
+    return lambda: buffer.view(ctypes.c_float)
+
+
+def _register_read_file(mapped: bool):
+    @suite.register(f"FileSystem.read_file_binary 8MiB{' mapped' if mapped else ''}")
+    def setup():
+        from Core.FileSystem import FileSystem
+        handle, path = tempfile.mkstemp(prefix="saw-bench-")
+        with os.fdopen(handle, "wb") as f:
+            f.write(os.urandom(8 << 20))
+        atexit.register(os.remove, path)
+
+        def run():
+            buffer = FileSystem.read_file_binary(path, mapped=mapped)
+            buffer.release()
+        return run
+
+
+_register_read_file(False)
+_register_read_file(True)
+
+
+@suite.register("MulticastDelegate.invoke 8 callbacks")
+def _setup_delegate():
+    from Core.Delegate import MulticastDelegate
+    delegate = MulticastDelegate()
+    for i in range(8):
+        delegate.bind(lambda value, i=i: None)
+    return lambda: delegate.invoke(1)
+
+
+def _register_reed_solomon(name: str, error_rate: float | None):
+    @suite.register(f"ReedSolomonCodec.{name} 64KiB")
+    def setup():
+        import numpy as np
+        from Signal.FEC import ReedSolomonCodec
+        codec = ReedSolomonCodec()
+        payload = os.urandom(64 * 1024)
+        if error_rate is None:
+            return lambda: codec.encode(payload)
+        encoded = np.frombuffer(codec.encode(payload), dtype=np.uint8).copy()
+        rng = np.random.default_rng(0)
+        hits = rng.choice(encoded.size, int(encoded.size * error_rate), replace=False)
+        encoded[hits] ^= 0x5A
+        received = encoded.tobytes()
+        return lambda: codec.decode(received)
+
+
+_register_reed_solomon("encode", None)
+_register_reed_solomon("decode", 0.0)
+_register_reed_solomon("decode 1% errors", 0.01)
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description="SAW benchmark suite")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    run_parser = commands.add_parser("run", help="run benchmarks")
+    run_parser.add_argument("-k", "--filter", help="only run benchmarks whose name contains this")
+    run_parser.add_argument("--repeat", type=int, default=20)
+    run_parser.add_argument("--warmup", type=int, default=3)
+    run_parser.add_argument("--save", metavar="FILE", help="write results as a JSON baseline")
+    run_parser.add_argument("--compare", metavar="FILE", help="compare against a saved baseline")
+    run_parser.add_argument("--threshold", type=float, default=0.10, help="regression threshold (fraction)")
+
+    compare_parser = commands.add_parser("compare", help="compare two saved baselines")
+    compare_parser.add_argument("baseline")
+    compare_parser.add_argument("current")
+    compare_parser.add_argument("--threshold", type=float, default=0.10)
+
+    commands.add_parser("list", help="list benchmark names")
+
+    args = parser.parse_args(argv)
+    if args.command == "list":
+        for name in suite.benchmarks:
+            print(name)
+        return 0
+
+    if args.command == "compare":
+        regressions = compare(load_baseline(args.baseline), load_baseline(args.current), args.threshold)
+        return 1 if regressions else 0
+
+    results = suite.run(args.filter, args.repeat, args.warmup)
+    if args.save:
+        save_baseline(results, args.save)
+    if args.compare:
+        print()
+        current = {name: result.to_dict() for name, result in results.items()}
+        baseline = load_baseline(args.compare)
+        if args.filter:
+            baseline = {name: entry for name, entry in baseline.items() if args.filter in name}
+        regressions = compare(baseline, current, args.threshold)
+        return 1 if regressions else 0
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,68 @@
+import argparse
+import os
+import subprocess
+import sys
+
+SOURCE_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+
+
+class ImportEntry:
+    __slots__ = ("module", "self_us", "cumulative_us", "depth")
+
+    def __init__(self, module: str, self_us: int, cumulative_us: int, depth: int):
+        self.module = module
+        self.self_us = self_us
+        self.cumulative_us = cumulative_us
+        self.depth = depth
+
+
+def parse_importtime(output: str) -> list[ImportEntry]:
+    """Parse the stderr of `python -X importtime`: 'import time: self | cumulative | module'."""
+    entries = []
+    for line in output.splitlines():
+        if not line.startswith("import time:"):
+            continue
+        fields = line[len("import time:"):].split("|")
+        if len(fields) != 3 or not fields[0].strip().isdigit():
+            continue  # header line
+        name = fields[2].rstrip()
+        stripped = name.lstrip()
+        depth = (len(name) - len(stripped) - 1) // 2
+        entries.append(ImportEntry(stripped, int(fields[0]), int(fields[1]), depth))
+    return entries
+
+
+def measure_imports(module: str = "main", cwd: str = SOURCE_ROOT) -> list[ImportEntry]:
+    """Import `module` in a fresh interpreter with -X importtime and return what it imported."""
+    result = subprocess.run([sys.executable, "-X", "importtime", "-c", f"import {module}"],
+                            cwd=cwd, capture_output=True, text=True)
+    if result.returncode != 0:
+        raise RuntimeError(f"Importing '{module}' failed:\n{result.stderr[-2000:]}")
+    return parse_importtime(result.stderr)
+
+
+def print_report(module: str, entries: list[ImportEntry], top: int = 20, project_only: bool = False):
+    target = next((e for e in entries if e.module == module), None)
+    total_us = target.cumulative_us if target else sum(e.self_us for e in entries)
+    print(f"import {module}: {total_us / 1000.0:.1f} ms, {len(entries)} modules")
+
+    shown = [e for e in entries if not project_only or e.module.split(".")[0] in ("Core", "Debug", "Signal")]
+    print(f"\n{'cumulative':>12} {'self':>10}  module")
+    for entry in sorted(shown, key=lambda e: -e.cumulative_us)[:top]:
+        print(f"{entry.cumulative_us / 1000.0:9.2f} ms {entry.self_us / 1000.0:7.2f} ms  "
+              f"{'  ' * entry.depth}{entry.module}")
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description="Import-time report for a SAW module")
+    parser.add_argument("module", nargs="?", default="main", help="module to import (default: main)")
+    parser.add_argument("--top", type=int, default=20)
+    parser.add_argument("--project", action="store_true", help="only show Core/Debug/Signal modules")
+    args = parser.parse_args(argv)
+
+    print_report(args.module, measure_imports(args.module), args.top, args.project)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
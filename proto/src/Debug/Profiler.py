@@ -1,45 +1,250 @@
+import contextlib
+import functools
+import json
 import os
+import sys
+import threading
+from collections import deque
+from time import perf_counter_ns
 
 # Enable profiling unless we're in a "dist" build
 SAW_DIST = os.getenv("SAW_DIST", "0") == "1"
 SAW_ENABLE_PROFILING = not SAW_DIST
 
+
+class ProfilerThreadBuffer:
+    """Preallocated ring of zones for one thread; only that thread writes to it."""
+    __slots__ = ("thread_id", "name", "names", "starts", "ends", "cursor", "count")
+
+    def __init__(self, thread_id: int, name: str, capacity: int):
+        self.thread_id = thread_id
+        self.name = name
+        self.names = [None] * capacity
+        self.starts = [0] * capacity
+        self.ends = [0] * capacity
+        self.cursor = 0
+        self.count = 0  # total zones recorded, including overwritten ones
+
+    def zones(self):
+        """Recorded (name, start_ns, end_ns) in chronological order."""
+        capacity = len(self.names)
+        if self.count < capacity:
+            order = range(self.count)
+        else:
+            order = [(self.cursor + i) % capacity for i in range(capacity)]
+        for i in order:
+            yield self.names[i], self.starts[i], self.ends[i]
+
+    def compact(self):
+        """Shrink the ring to just the recorded zones, for a thread that has exited."""
+        zones = list(self.zones())
+        self.names = [zone[0] for zone in zones]
+        self.starts = [zone[1] for zone in zones]
+        self.ends = [zone[2] for zone in zones]
+        self.cursor = 0
+        self.count = len(zones)
+
+
+class _ThreadExitHook:
+    # Stored in Profiler._local: thread-local values are dropped when their thread exits
+    __slots__ = ("buffer",)
+
+    def __init__(self, buffer: ProfilerThreadBuffer):
+        self.buffer = buffer
+
+    def __del__(self):
+        Profiler.retire_thread_buffer(self.buffer)
+
+
+class Profiler:
+    """
+    Instrumentation recorder behind the SAW_PROFILE_* macros. Zones are
+    perf_counter_ns timestamps kept in per-thread ring buffers (oldest zones
+    are overwritten); frame marks and thread names are kept alongside. When a
+    thread exits its ring is shrunk to the zones it recorded, and exited
+    threads' zones beyond RETIRED_CAPACITY are dropped oldest first.
+    """
+
+    CAPACITY = 1 << 16          # zones per thread, power of two
+    FRAME_CAPACITY = 1 << 14    # frame marks
+    RETIRED_CAPACITY = 1 << 16  # zones kept in total for threads that have exited
+
+    _local = threading.local()
+    _buffers: list[ProfilerThreadBuffer] = []
+    _retired: deque[ProfilerThreadBuffer] = deque()  # exited threads' buffers, oldest first
+    _retired_zones = 0
+    _profiled_threads: dict[int, threading.Thread] = {}  # opted in via SAW_PROFILE_THREAD
+    _lock = threading.Lock()
+    _frames = [0] * FRAME_CAPACITY
+    _frame_count = 0
+    _origin_ns = perf_counter_ns()
+
+    @staticmethod
+    def get_thread_buffer() -> ProfilerThreadBuffer:
+        buffer = getattr(Profiler._local, "buffer", None)
+        if buffer is None:
+            thread = threading.current_thread()
+            buffer = ProfilerThreadBuffer(thread.ident, thread.name, Profiler.CAPACITY)
+            Profiler._local.buffer = buffer
+            Profiler._local.exit_hook = _ThreadExitHook(buffer)
+            with Profiler._lock:
+                Profiler._buffers.append(buffer)
+        return buffer
+
+    @staticmethod
+    def retire_thread_buffer(buffer: ProfilerThreadBuffer):
+        """Release an exited thread's ring, keeping its recorded zones for export."""
+        with Profiler._lock:
+            if buffer not in Profiler._buffers:
+                return
+            if buffer.count == 0:
+                Profiler._buffers.remove(buffer)
+                return
+            buffer.compact()
+            Profiler._retired.append(buffer)
+            Profiler._retired_zones += buffer.count
+            while Profiler._retired_zones > Profiler.RETIRED_CAPACITY:
+                oldest = Profiler._retired.popleft()
+                Profiler._retired_zones -= oldest.count
+                Profiler._buffers.remove(oldest)
+
+    @staticmethod
+    def record(name: str, start_ns: int, end_ns: int):
+        buffer = getattr(Profiler._local, "buffer", None) or Profiler.get_thread_buffer()
+        i = buffer.cursor
+        buffer.names[i] = name
+        buffer.starts[i] = start_ns
+        buffer.ends[i] = end_ns
+        buffer.cursor = (i + 1) & (Profiler.CAPACITY - 1)
+        buffer.count += 1
+
+    @staticmethod
+    def mark_frame():
+        Profiler._frames[Profiler._frame_count & (Profiler.FRAME_CAPACITY - 1)] = perf_counter_ns()
+        Profiler._frame_count += 1
+
+    @staticmethod
+    def set_thread_name(name: str):
+        thread = threading.current_thread()
+        thread.name = name
+        Profiler.get_thread_buffer().name = name
+        with Profiler._lock:
+            Profiler._profiled_threads[thread.ident] = thread
+
+    @staticmethod
+    def profiled_threads() -> dict[int, str]:
+        """Live threads that opted in via SAW_PROFILE_THREAD, by thread id."""
+        with Profiler._lock:
+            threads = Profiler._profiled_threads
+            # Drop finished threads, whose ids the OS may hand to new ones
+            for thread_id in [i for i, thread in threads.items() if not thread.is_alive()]:
+                del threads[thread_id]
+            return {thread_id: thread.name for thread_id, thread in threads.items()}
+
+    @staticmethod
+    def thread_names() -> dict[int, str]:
+        with Profiler._lock:
+            return {buffer.thread_id: buffer.name for buffer in Profiler._buffers}
+
+    @staticmethod
+    def frame_times() -> list[int]:
+        count = Profiler._frame_count
+        if count <= Profiler.FRAME_CAPACITY:
+            return Profiler._frames[:count]
+        start = count & (Profiler.FRAME_CAPACITY - 1)
+        return Profiler._frames[start:] + Profiler._frames[:start]
+
+    @staticmethod
+    def clear():
+        with Profiler._lock:
+            for buffer in Profiler._retired:
+                Profiler._buffers.remove(buffer)
+            Profiler._retired.clear()
+            Profiler._retired_zones = 0
+            for buffer in Profiler._buffers:
+                buffer.cursor = 0
+                buffer.count = 0
+            Profiler._frame_count = 0
+
+    @staticmethod
+    def chrome_trace_events() -> list[dict]:
+        """Trace events in the Chrome trace-event / Perfetto JSON format (microseconds)."""
+        pid = os.getpid()
+        origin = Profiler._origin_ns
+        events = []
+        with Profiler._lock:
+            buffers = list(Profiler._buffers)
+
+        for buffer in buffers:
+            events.append({"ph": "M", "name": "thread_name", "pid": pid, "tid": buffer.thread_id,
+                           "args": {"name": buffer.name}})
+            for name, start, end in buffer.zones():
+                events.append({"ph": "X", "name": name, "cat": "zone", "pid": pid, "tid": buffer.thread_id,
+                               "ts": (start - origin) / 1000.0, "dur": (end - start) / 1000.0})
+
+        for index, timestamp in enumerate(Profiler.frame_times()):
+            events.append({"ph": "i", "name": "Frame", "cat": "frame", "s": "g", "pid": pid, "tid": 0,
+                           "ts": (timestamp - origin) / 1000.0, "args": {"frame": index}})
+        return events
+
+    @staticmethod
+    def export_chrome_trace(filepath: str):
+        """Write a trace loadable by chrome://tracing or ui.perfetto.dev."""
+        directory = os.path.dirname(os.path.abspath(filepath))
+        os.makedirs(directory, exist_ok=True)
+        with open(filepath, "w", encoding="utf-8") as f:
+            json.dump({"traceEvents": Profiler.chrome_trace_events(), "displayTimeUnit": "ms"}, f)
+
+
+class ProfileZone:
+    __slots__ = ("name", "start")
+
+    def __init__(self, name: str):
+        self.name = name
+
+    def __enter__(self):
+        self.start = perf_counter_ns()
+        return self
+
+    def __exit__(self, *exc):
+        Profiler.record(self.name, self.start, perf_counter_ns())
+        return False
+
+
 if SAW_ENABLE_PROFILING:
-    # Placeholder imports / setup for a profiling library
-    # In real use, you could integrate with something like yappi or cProfile
     def SAW_PROFILE_MARK_FRAME():
-        pass  # Frame marking logic
+        Profiler.mark_frame()
 
     def SAW_PROFILE_FUNC(name=None):
         def decorator(func):
+            zone_name = name or func.__qualname__
+            record = Profiler.record
+
+            @functools.wraps(func)
             def wrapper(*args, **kwargs):
-                # Start profiling zone
-                result = func(*args, **kwargs)
-                # End profiling zone
-                return result
+                start = perf_counter_ns()
+                try:
+                    return func(*args, **kwargs)
+                finally:
+                    record(zone_name, start, perf_counter_ns())
             return wrapper
         return decorator
 
     def SAW_PROFILE_SCOPE(name=None):
         # Can be used as a context manager
-        from contextlib import contextmanager
-        @contextmanager
-        def profiler_scope():
-            # Enter profiling scope
-            yield
-            # Exit profiling scope
-        return profiler_scope()
+        return ProfileZone(name or sys._getframe(1).f_code.co_name)
 
     def SAW_PROFILE_SCOPE_DYNAMIC(name):
-        return SAW_PROFILE_SCOPE(name)
+        return ProfileZone(name)
 
     def SAW_PROFILE_THREAD(name):
-        # Set thread name for profiler if supported
-        import threading
-        threading.current_thread().name = name
+        # Set thread name for profiler and threading
+        Profiler.set_thread_name(name)
 
 else:
     # No-op implementations
+    _NULL_SCOPE = contextlib.nullcontext()
+
     def SAW_PROFILE_MARK_FRAME():
         pass
 
@@ -49,18 +254,18 @@ else:
         return decorator
 
     def SAW_PROFILE_SCOPE(name=None):
-        from contextlib import contextmanager
-        @contextmanager
-        def dummy_scope():
-            yield
-        return dummy_scope()
+        return _NULL_SCOPE
 
     def SAW_PROFILE_SCOPE_DYNAMIC(name):
-        return SAW_PROFILE_SCOPE(name)
+        return _NULL_SCOPE
 
     def SAW_PROFILE_THREAD(name):
         pass
 
+def SAW_PROFILE_EXPORT(filepath: str):
+    if SAW_ENABLE_PROFILING:
+        Profiler.export_chrome_trace(filepath)
+
 import time
 
 # Example usage of SAW profiler
@@ -79,6 +284,7 @@ def main():
         my_function()
         with SAW_PROFILE_SCOPE_DYNAMIC("dynamic_scope"):
             time.sleep(0.05)
+    SAW_PROFILE_EXPORT("profile.json")  # Open in chrome://tracing or ui.perfetto.dev
 
 if __name__ == "__main__":
     main()
@@ -0,0 +1,168 @@
+import os
+import sys
+import threading
+import time
+from time import perf_counter
+
+from Debug.Profiler import Profiler, SAW_ENABLE_PROFILING
+
+
+class SamplingProfiler:
+    """
+    Statistical profiler: a background thread snapshots sys._current_frames()
+    every `interval` seconds for the threads named via SAW_PROFILE_THREAD (or
+    every thread with all_threads=True) and counts collapsed stacks.
+    Memory is bounded by max_stacks distinct stacks; samples of new stacks
+    beyond that are counted under "<thread>;[other]". Output is the collapsed
+    format consumed by flamegraph.pl / speedscope.
+    """
+
+    OTHER = "[other]"
+
+    def __init__(self, interval: float = 0.01, max_stacks: int = 20000, max_depth: int = 128,
+                 all_threads: bool = False):
+        self.interval = interval
+        self.max_stacks = max_stacks
+        self.max_depth = max_depth
+        self.all_threads = all_threads
+
+        self.counts: dict[str, int] = {}
+        self.samples = 0
+        self.sampling_seconds = 0.0  # time spent inside the sampler
+        self.running_seconds = 0.0
+
+        self._labels: dict = {}  # code object -> "function (file:line)"
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._thread: threading.Thread | None = None
+        self._started_at = 0.0
+
+    def is_running(self) -> bool:
+        return self._thread is not None and self._thread.is_alive()
+
+    def start(self):
+        if not SAW_ENABLE_PROFILING or self.is_running():
+            return
+        self._stop.clear()
+        self._started_at = perf_counter()
+        self._thread = threading.Thread(target=self._run, name="SAW-Sampler", daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        if not self.is_running():
+            return
+        self._stop.set()
+        self._thread.join()
+        self._thread = None
+        self.running_seconds += perf_counter() - self._started_at
+
+    def set_enabled(self, enabled: bool):
+        """Start or stop sampling at runtime; collected samples are kept."""
+        if enabled:
+            self.start()
+        else:
+            self.stop()
+
+    def toggle(self) -> bool:
+        self.set_enabled(not self.is_running())
+        return self.is_running()
+
+    def clear(self):
+        with self._lock:
+            self.counts.clear()
+            self.samples = 0
+            self.sampling_seconds = 0.0
+
+    def overhead(self) -> float:
+        """Fraction of wall time spent taking samples (on the sampler thread)."""
+        elapsed = self.running_seconds + (perf_counter() - self._started_at if self.is_running() else 0.0)
+        return self.sampling_seconds / elapsed if elapsed > 0.0 else 0.0
+
+    def _label(self, code) -> str:
+        label = self._labels.get(code)
+        if label is None:
+            label = f"{code.co_name} ({os.path.basename(code.co_filename)}:{code.co_firstlineno})"
+            if len(self._labels) < 4 * self.max_stacks:
+                self._labels[code] = label
+        return label
+
+    def _targets(self) -> dict[int, str]:
+        if self.all_threads:
+            return {thread.ident: thread.name for thread in threading.enumerate()}
+        return Profiler.profiled_threads()
+
+    def sample(self):
+        """Take one sample of every target thread."""
+        start = perf_counter()
+        own_id = threading.get_ident()
+        frames = sys._current_frames()
+        targets = self._targets()
+
+        stacks = []
+        for thread_id, thread_name in targets.items():
+            frame = frames.get(thread_id)
+            if frame is None or thread_id == own_id:
+                continue
+            parts = []
+            while frame is not None and len(parts) < self.max_depth:
+                parts.append(self._label(frame.f_code))
+                frame = frame.f_back
+            parts.append(thread_name)
+            parts.reverse()
+            stacks.append(";".join(parts))
+        del frames
+
+        with self._lock:
+            for stack in stacks:
+                if stack in self.counts:
+                    self.counts[stack] += 1
+                elif len(self.counts) < self.max_stacks:
+                    self.counts[stack] = 1
+                else:
+                    other = stack.split(";", 1)[0] + ";" + SamplingProfiler.OTHER
+                    self.counts[other] = self.counts.get(other, 0) + 1
+            self.samples += 1
+            self.sampling_seconds += perf_counter() - start
+
+    def _run(self):
+        next_time = perf_counter()
+        while not self._stop.is_set():
+            self.sample()
+            next_time += self.interval
+            delay = next_time - perf_counter()
+            if delay < 0.0:
+                # Fell behind (e.g. a long GIL hold); skip missed ticks instead of bursting
+                next_time = perf_counter()
+                delay = 0.0
+            self._stop.wait(delay)
+
+    def collapsed(self) -> list[str]:
+        with self._lock:
+            items = sorted(self.counts.items(), key=lambda item: -item[1])
+        return [f"{stack} {count}" for stack, count in items]
+
+    def write_collapsed(self, filepath: str):
+        with open(filepath, "w", encoding="utf-8") as f:
+            for line in self.collapsed():
+                f.write(line + "\n")
+
+
+if __name__ == "__main__":
+    from Debug.Profiler import SAW_PROFILE_THREAD
+
+    def busy(duration: float):
+        end = time.perf_counter() + duration
+        total = 0
+        while time.perf_counter() < end:
+            total += sum(i * i for i in range(200))
+        return total
+
+    SAW_PROFILE_THREAD("Main")
+    sampler = SamplingProfiler(interval=0.005)
+    sampler.start()
+    busy(1.0)
+    sampler.stop()
+
+    for line in sampler.collapsed()[:5]:
+        print(line)
+    print(f"{sampler.samples} samples, overhead {sampler.overhead() * 100.0:.2f}%")
@@ -0,0 +1,210 @@
+import math
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+
+from Core.FastRandom import FastRandom
+from Signal.Modem import ModemConfig, PRWNSequence
+
+
+class ChannelConfig:
+    """Chip-rate baseband model of the SAW link between two IDTs."""
+
+    def __init__(self):
+        self.decay_coefficient = 0.2            # amplitude decay per unit distance, exp(-decay * distance)
+        self.echoes = [(3, 0.3), (11, 0.1)]     # multipath taps: (delay in chips, gain relative to direct path)
+        self.vibration_amplitude = 0.0          # sinusoidal interference amplitude, relative to a unit chip
+        self.vibration_frequency = 120.0        # Hz
+        self.chip_rate = 24000.0                # chips per second (ModemConfig.sample_rate / samples_per_chip)
+
+    def gain(self, distance: float) -> float:
+        return math.exp(-self.decay_coefficient * distance)
+
+
+def wilson_interval(errors, trials, z: float = 1.96):
+    """Wilson score interval for a binomial proportion (95% for z=1.96); works on arrays."""
+    errors = np.asarray(errors, dtype=np.float64)
+    trials = np.maximum(np.asarray(trials, dtype=np.float64), 1.0)
+    p = errors / trials
+    denominator = 1.0 + z * z / trials
+    centre = (p + z * z / (2.0 * trials)) / denominator
+    half_width = z * np.sqrt(p * (1.0 - p) / trials + z * z / (4.0 * trials * trials)) / denominator
+    return np.maximum(centre - half_width, 0.0), np.minimum(centre + half_width, 1.0)
+
+
+class BERCurve:
+    """BER estimates on a (distance, snr) grid with Wilson 95% confidence intervals."""
+
+    def __init__(self, snr_db, distances, errors: np.ndarray, bits: np.ndarray, seconds: float):
+        self.snr_db = np.asarray(snr_db, dtype=np.float64)
+        self.distances = np.asarray(distances, dtype=np.float64)
+        self.errors = errors
+        self.bits = bits
+        self.seconds = seconds
+
+    @property
+    def ber(self) -> np.ndarray:
+        return self.errors / np.maximum(self.bits, 1)
+
+    def confidence_interval(self, z: float = 1.96) -> tuple[np.ndarray, np.ndarray]:
+        return wilson_interval(self.errors, self.bits, z)
+
+    def format_table(self) -> str:
+        low, high = self.confidence_interval()
+        lines = [f"{'distance':>9} {'Eb/N0 dB':>9} {'bits':>10} {'errors':>8} {'BER':>10}  95% CI"]
+        for i, distance in enumerate(self.distances):
+            for j, snr in enumerate(self.snr_db):
+                lines.append(f"{distance:9.2f} {snr:9.1f} {self.bits[i, j]:10d} {self.errors[i, j]:8d} "
+                             f"{self.ber[i, j]:10.3e}  [{low[i, j]:.2e}, {high[i, j]:.2e}]")
+        return "\n".join(lines)
+
+
+def bpsk_theoretical_ber(snr_db) -> np.ndarray:
+    """AWGN-only BPSK reference: 0.5 * erfc(sqrt(Eb/N0))."""
+    snr = 10.0 ** (np.asarray(snr_db, dtype=np.float64) / 10.0)
+    return np.array([0.5 * math.erfc(math.sqrt(value)) for value in np.ravel(snr)]).reshape(np.shape(snr))
+
+
+def gaussian_noise(random: FastRandom, count: int, sigma: float) -> np.ndarray:
+    """Normal samples via Box-Muller, one FastRandom draw per sample (LCG states are never 0)."""
+    half = (count + 1) // 2
+    uniform = random.get_float64_array(2 * half)
+    radius = np.sqrt(-2.0 * np.log(uniform[:half])) * sigma
+    angle = (2.0 * np.pi) * uniform[half:]
+    noise = np.empty(2 * half, dtype=np.float32)
+    noise[:half] = radius * np.cos(angle)
+    noise[half:] = radius * np.sin(angle)
+    return noise[:count]
+
+
+class ChannelSimulator:
+    """
+    Monte Carlo BER estimation for the PRWN link. Each batch spreads random
+    bits with the modem's PRWN code, applies distance attenuation, multipath
+    echoes, vibration interference and AWGN at chip rate, then despreads and
+    counts bit errors, all as whole-array operations. Eb/N0 is referenced to
+    the transmitter (distance 0); attenuation lowers the received SNR.
+    """
+
+    def __init__(self, channel: ChannelConfig | None = None, modem: ModemConfig | None = None,
+                 batch_bits: int = 1 << 16):
+        self.channel = channel or ChannelConfig()
+        self.modem = modem or ModemConfig()
+        self.batch_bits = batch_bits
+        chips = self.modem.chips_per_bit
+        # The code is deterministic (known to both ends), so one block is reused across batches
+        self._code = PRWNSequence(self.modem.seed).next_chips(batch_bits * chips)
+
+    def run_batch(self, random: FastRandom, snr_db: float, distance: float, num_bits: int) -> int:
+        """Simulate num_bits (<= batch_bits) and return the number of bit errors."""
+        channel = self.channel
+        chips_per_bit = self.modem.chips_per_bit
+        num_chips = num_bits * chips_per_bit
+        code = self._code[:num_chips]
+
+        bits = (random.get_int32_array(num_bits) & 1).astype(np.bool_)
+        symbols = np.where(bits, np.float32(1.0), np.float32(-1.0))
+        transmitted = np.repeat(symbols, chips_per_bit) * code
+
+        received = transmitted.copy()
+        for delay, echo_gain in channel.echoes:
+            if 0 < delay < num_chips:
+                received[delay:] += np.float32(echo_gain) * transmitted[:-delay]
+        received *= np.float32(channel.gain(distance))
+
+        if channel.vibration_amplitude > 0.0:
+            phase = 2.0 * np.pi * random.get_float64()
+            n = np.arange(num_chips, dtype=np.float64)
+            omega = 2.0 * np.pi * channel.vibration_frequency / channel.chip_rate
+            received += (channel.vibration_amplitude * np.sin(omega * n + phase)).astype(np.float32)
+
+        # Eb = chips_per_bit (unit chips), N0 = 2 sigma^2
+        sigma = math.sqrt(chips_per_bit / (2.0 * 10.0 ** (snr_db / 10.0)))
+        received += gaussian_noise(random, num_chips, sigma)
+
+        decisions = (received * code).reshape(num_bits, chips_per_bit).sum(axis=1) > 0.0
+        return int(np.count_nonzero(decisions != bits))
+
+    def simulate_point(self, random: FastRandom, snr_db: float, distance: float,
+                       max_bits: int, min_errors: int = 200) -> tuple[int, int]:
+        """Run batches until min_errors errors or max_bits bits; returns (errors, bits)."""
+        errors = bits = 0
+        while bits < max_bits and errors < min_errors:
+            count = min(self.batch_bits, max_bits - bits)
+            errors += self.run_batch(random, snr_db, distance, count)
+            bits += count
+        return errors, bits
+
+
+# Per-process simulator, built once by the pool initializer
+_worker_simulator: ChannelSimulator | None = None
+
+
+def _init_worker(channel: ChannelConfig, modem: ModemConfig, batch_bits: int):
+    global _worker_simulator
+    _worker_simulator = ChannelSimulator(channel, modem, batch_bits)
+
+
+def _run_point(seed: int, index: int, stream_length: int, snr_db: float, distance: float,
+               max_bits: int, min_errors: int) -> tuple[int, int]:
+    random = FastRandom(seed).substream(index, stream_length)
+    return _worker_simulator.simulate_point(random, snr_db, distance, max_bits, min_errors)
+
+
+def estimate_ber(snr_db, distances=(0.0,), channel: ChannelConfig | None = None,
+                 modem: ModemConfig | None = None, max_bits: int = 1 << 21, min_errors: int = 200,
+                 seed: int = FastRandom.DEFAULT_SEED, num_workers: int | None = None,
+                 batch_bits: int = 1 << 16) -> BERCurve:
+    """
+    BER for every (distance, Eb/N0) pair, spread across worker processes.
+    Point i draws from FastRandom(seed).substream(i, ...), so results are
+    reproducible regardless of worker count. The generator's period (2^31 - 2)
+    is split evenly between points, which caps max_bits per point.
+    """
+    channel = channel or ChannelConfig()
+    modem = modem or ModemConfig()
+    snr_db = np.atleast_1d(np.asarray(snr_db, dtype=np.float64))
+    distances = np.atleast_1d(np.asarray(distances, dtype=np.float64))
+    points = [(float(d), float(s)) for d in distances for s in snr_db]
+
+    draws_per_bit = modem.chips_per_bit + 2  # bit + per-chip noise, with margin for per-batch draws
+    stream_length = (FastRandom.LCG_MODULUS - 1) // len(points)
+    if max_bits * draws_per_bit > stream_length:
+        max_bits = stream_length // draws_per_bit
+    num_workers = max(1, min(num_workers or os.cpu_count() or 1, len(points)))
+
+    start = time.perf_counter()
+    args = [(seed, i, stream_length, snr, distance, max_bits, min_errors) for i, (distance, snr) in enumerate(points)]
+    if num_workers == 1:
+        _init_worker(channel, modem, batch_bits)
+        results = [_run_point(*arg) for arg in args]
+    else:
+        with ProcessPoolExecutor(max_workers=num_workers, initializer=_init_worker,
+                                 initargs=(channel, modem, batch_bits)) as pool:
+            results = list(pool.map(_run_point, *zip(*args)))
+
+    shape = (distances.size, snr_db.size)
+    errors = np.array([r[0] for r in results], dtype=np.int64).reshape(shape)
+    bits = np.array([r[1] for r in results], dtype=np.int64).reshape(shape)
+    return BERCurve(snr_db, distances, errors, bits, time.perf_counter() - start)
+
+
+if __name__ == "__main__":
+    snr = np.arange(0.0, 9.0, 2.0)
+
+    awgn = ChannelConfig()
+    awgn.echoes = []
+    reference = estimate_ber(snr, channel=awgn)
+    print("AWGN only, distance 0:")
+    print(reference.format_table())
+    print(f"theory: {np.array2string(bpsk_theoretical_ber(snr), precision=2)}")
+
+    channel = ChannelConfig()
+    channel.vibration_amplitude = 0.5
+    curve = estimate_ber(snr, distances=[0.0, 2.0, 5.0], channel=channel)
+    print("\nAttenuation + multipath + vibration:")
+    print(curve.format_table())
+    total_bits = int(reference.bits.sum() + curve.bits.sum())
+    print(f"\n{total_bits} bits in {reference.seconds + curve.seconds:.2f} s")
@@ -0,0 +1,314 @@
+import time
+from typing import Iterable, Iterator
+
+import numpy as np
+
+from Signal.Modem import ModemStats
+
+
+class GF256:
+    """GF(2^8) tables for the primitive polynomial x^8 + x^4 + x^3 + x^2 + 1 (0x11d), generator 2."""
+
+    PRIMITIVE = 0x11D
+
+    def __init__(self):
+        self.exp = np.zeros(512, dtype=np.uint8)
+        self.log = np.zeros(256, dtype=np.int32)
+        value = 1
+        for power in range(255):
+            self.exp[power] = value
+            self.log[value] = power
+            value <<= 1
+            if value & 0x100:
+                value ^= GF256.PRIMITIVE
+        self.exp[255:510] = self.exp[:255]
+
+        # Full product table: one lookup per multiply on whole arrays
+        logs = self.log[1:]
+        self.mul = np.zeros((256, 256), dtype=np.uint8)
+        self.mul[1:, 1:] = self.exp[logs[:, np.newaxis] + logs[np.newaxis, :]]
+
+    def multiply(self, a: int, b: int) -> int:
+        return int(self.mul[a, b])
+
+    def inverse(self, a: int) -> int:
+        return int(self.exp[255 - self.log[a]])
+
+    def divide(self, a: int, b: int) -> int:
+        if a == 0:
+            return 0
+        return int(self.exp[(self.log[a] - self.log[b]) % 255])
+
+    def power(self, exponent: int) -> int:
+        return int(self.exp[exponent % 255])
+
+    def poly_eval(self, coefficients: list[int], x: int) -> int:
+        """Evaluate a polynomial given lowest-degree coefficient first."""
+        result = 0
+        for coefficient in reversed(coefficients):
+            result = int(self.mul[result, x]) ^ coefficient
+        return result
+
+
+class FECStats(ModemStats):
+    def __init__(self):
+        super().__init__()
+        self.codewords = 0
+        self.corrected_symbols = 0
+        self.failed_codewords = 0  # too many errors to correct; passed through unchanged
+
+    def __repr__(self) -> str:
+        return (f"FECStats({self.bytes} bytes, {self.codewords} codewords, {self.corrected_symbols} corrected, "
+                f"{self.failed_codewords} failed, {self.megabytes_per_second:.3f} MB/s)")
+
+
+class ReedSolomonCodec:
+    """
+    Systematic Reed-Solomon RS(n, k) over GF(256), by default RS(255, 223)
+    correcting up to 16 byte errors per codeword. A chunk is split into
+    codewords (the first one shortened with virtual leading zeros) that are
+    encoded together: parity is one product-row gather per message byte
+    followed by an XOR reduction, and decoding computes all syndromes the
+    same way. Only codewords with nonzero syndromes go through
+    Berlekamp-Massey, Chien search and Forney. With interleave=True the
+    codewords are sent column by column, so a burst of up to
+    codewords * (n - k) / 2 bytes is spread across codewords.
+    """
+
+    def __init__(self, n: int = 255, k: int = 223, interleave: bool = True):
+        if not 0 < k < n <= 255 or (n - k) % 2:
+            raise ValueError("Reed-Solomon needs 0 < k < n <= 255 with an even number of parity bytes")
+        self.n = n
+        self.k = k
+        self.parity = n - k
+        self.interleave = interleave
+        self.gf = GF256()
+        self.encode_stats = FECStats()
+        self.decode_stats = FECStats()
+
+        gf = self.gf
+        # Generator polynomial prod(x - a^j), j = 0..parity-1, highest degree first
+        generator = [1]
+        for j in range(self.parity):
+            root = gf.power(j)
+            generator = [a ^ gf.multiply(b, root) for a, b in zip(generator + [0], [0] + generator)]
+
+        # Row i holds x^(parity + k - 1 - i) mod g(x), so parity = XOR_i message[i] * row[i]
+        rows = np.zeros((k, self.parity), dtype=np.uint8)
+        remainder = generator[1:]
+        for i in range(k - 1, -1, -1):
+            rows[i] = remainder
+            carry = remainder[0]
+            remainder = remainder[1:] + [0]
+            if carry:
+                remainder = [r ^ gf.multiply(carry, g) for r, g in zip(remainder, generator[1:])]
+        self._parity_table = self._product_table(rows)
+
+        # Syndrome j of a received word r is XOR_i r[i] * a^(j * (n - 1 - i))
+        exponents = np.outer(np.arange(n - 1, -1, -1), np.arange(self.parity)) % 255
+        self._syndrome_table = self._product_table(gf.exp[exponents])
+
+    def encoded_length(self, length: int) -> int:
+        return length + -(-length // self.k) * self.parity
+
+    def decoded_length(self, length: int) -> int:
+        return length - -(-length // self.n) * self.parity
+
+    def _layout(self, codewords: int, pad: int) -> np.ndarray:
+        # Transmitted positions of the (codewords, n) block, in send order; the
+        # first codeword's `pad` virtual zeros are never sent
+        order = np.arange(codewords * self.n).reshape(codewords, self.n)
+        if self.interleave:
+            order = order.T
+        order = order.ravel()
+        return order[order >= pad] if pad else order
+
+    DOT_BATCH = 512  # codewords per gather, bounds the (batch, m, p) temporary
+
+    def _product_table(self, matrix: np.ndarray) -> np.ndarray:
+        # Row 256 * i + v holds v * matrix[i] for every byte value v, so a
+        # (message position, byte) pair maps to its whole product row in one gather
+        m, p = matrix.shape
+        return self.gf.mul[:, matrix].transpose(1, 0, 2).reshape(m * 256, p).copy()
+
+    def _dot(self, symbols: np.ndarray, table: np.ndarray) -> np.ndarray:
+        # (c, m) symbols times the (m, p) matrix behind `table`, over GF(256)
+        m = symbols.shape[1]
+        p = table.shape[1]
+        offsets = np.arange(m, dtype=np.intp) * 256
+        out = np.empty((symbols.shape[0], p), dtype=np.uint8)
+        # XOR whole 8-byte lanes at once when the row width allows it
+        lane = np.uint64 if p % 8 == 0 else np.uint8
+        for start in range(0, symbols.shape[0], ReedSolomonCodec.DOT_BATCH):
+            batch = symbols[start:start + ReedSolomonCodec.DOT_BATCH]
+            products = table[batch + offsets]
+            reduced = np.bitwise_xor.reduce(products.view(lane), axis=1)
+            out[start:start + batch.shape[0]] = reduced.view(np.uint8).reshape(-1, p)
+        return out
+
+    def encode(self, chunk: bytes | bytearray | memoryview) -> bytes:
+        start = time.perf_counter()
+        message = np.frombuffer(chunk, dtype=np.uint8)
+        if message.size == 0:
+            return b""
+        codewords = -(-message.size // self.k)
+        pad = codewords * self.k - message.size
+
+        data = np.zeros((codewords, self.k), dtype=np.uint8)
+        data.reshape(-1)[pad:] = message
+        block = np.empty((codewords, self.n), dtype=np.uint8)
+        block[:, :self.k] = data
+        block[:, self.k:] = self._dot(data, self._parity_table)
+        encoded = block.reshape(-1)[self._layout(codewords, pad)].tobytes()
+
+        stats = self.encode_stats
+        stats.bytes += message.size
+        stats.codewords += codewords
+        stats.seconds += time.perf_counter() - start
+        return encoded
+
+    def decode(self, data: bytes | bytearray | memoryview) -> bytes:
+        start = time.perf_counter()
+        received = np.frombuffer(data, dtype=np.uint8)
+        if received.size == 0:
+            return b""
+        codewords = -(-received.size // self.n)
+        pad = codewords * self.n - received.size
+
+        block = np.zeros(codewords * self.n, dtype=np.uint8)
+        block[self._layout(codewords, pad)] = received
+        block = block.reshape(codewords, self.n)
+
+        syndromes = self._dot(block, self._syndrome_table)
+        stats = self.decode_stats
+        for index in np.flatnonzero(syndromes.any(axis=1)):
+            corrected = self._correct(block[index], syndromes[index].tolist())
+            if corrected < 0:
+                stats.failed_codewords += 1
+            else:
+                stats.corrected_symbols += corrected
+
+        message = block[:, :self.k].reshape(-1)[pad:].tobytes()
+        stats.bytes += len(message)
+        stats.codewords += codewords
+        stats.seconds += time.perf_counter() - start
+        return message
+
+    def _correct(self, word: np.ndarray, syndromes: list[int]) -> int:
+        """Fix `word` in place; returns the number of corrected symbols or -1 if uncorrectable."""
+        gf = self.gf
+        locator, errors = self._berlekamp_massey(syndromes)
+        if errors == 0 or 2 * errors > self.parity:
+            return -1
+
+        # Chien search: roots a^-(n-1-i) of the locator mark error positions i
+        powers = np.arange(self.n - 1, -1, -1)
+        exponents = (-np.outer(powers, np.arange(errors + 1))) % 255
+        terms = gf.mul[np.asarray(locator, dtype=np.uint8)[np.newaxis, :], gf.exp[exponents]]
+        positions = np.flatnonzero(np.bitwise_xor.reduce(terms, axis=1) == 0)
+        if positions.size != errors:
+            return -1
+
+        # Forney: e = X * omega(X^-1) / locator'(X^-1), with omega = S * locator mod x^parity
+        omega = [0] * self.parity
+        for i, s in enumerate(syndromes):
+            if s:
+                for j, c in enumerate(locator[:self.parity - i]):
+                    omega[i + j] ^= gf.multiply(s, c)
+        derivative = [locator[i] if i % 2 == 1 else 0 for i in range(1, len(locator))]
+        for position in positions.tolist():
+            x = gf.power(self.n - 1 - position)
+            x_inverse = gf.inverse(x)
+            denominator = gf.poly_eval(derivative, x_inverse)
+            if denominator == 0:
+                return -1
+            magnitude = gf.multiply(x, gf.divide(gf.poly_eval(omega, x_inverse), denominator))
+            word[position] ^= magnitude
+        return errors
+
+    def _berlekamp_massey(self, syndromes: list[int]) -> tuple[list[int], int]:
+        gf = self.gf
+        current = [1]
+        previous = [1]
+        length = 0
+        shift = 1
+        previous_discrepancy = 1
+        for n, syndrome in enumerate(syndromes):
+            discrepancy = syndrome
+            for i in range(1, length + 1):
+                if i < len(current):
+                    discrepancy ^= gf.multiply(current[i], syndromes[n - i])
+            if discrepancy == 0:
+                shift += 1
+                continue
+            scale = gf.divide(discrepancy, previous_discrepancy)
+            updated = current + [0] * max(0, len(previous) + shift - len(current))
+            for i, coefficient in enumerate(previous):
+                updated[i + shift] ^= gf.multiply(scale, coefficient)
+            if 2 * length <= n:
+                previous, current = current, updated
+                length = n + 1 - length
+                previous_discrepancy = discrepancy
+                shift = 1
+            else:
+                current = updated
+                shift += 1
+        return current[:length + 1], length
+
+    def encode_chunks(self, chunks: Iterable[bytes]) -> Iterator[bytes]:
+        for chunk in chunks:
+            yield self.encode(chunk)
+
+
+class FECStreamDecoder:
+    """
+    Reassembles encoded chunks from a byte stream whose boundaries don't line
+    up with them (e.g. demodulator output) and decodes each one. Every chunk
+    except the last is assumed to be chunk_size payload bytes long.
+    """
+
+    def __init__(self, codec: ReedSolomonCodec, chunk_size: int):
+        self.codec = codec
+        self.frame_size = codec.encoded_length(chunk_size)
+        self._pending = bytearray()
+
+    def feed(self, data: bytes) -> list[bytes]:
+        self._pending += data
+        chunks = []
+        while len(self._pending) >= self.frame_size:
+            chunks.append(self.codec.decode(self._pending[:self.frame_size]))
+            del self._pending[:self.frame_size]
+        return chunks
+
+    def flush(self) -> bytes:
+        if not self._pending:
+            return b""
+        payload = self.codec.decode(self._pending)
+        self._pending.clear()
+        return payload
+
+
+if __name__ == "__main__":
+    import os
+
+    codec = ReedSolomonCodec()
+    rng = np.random.default_rng(3)
+    payload = os.urandom(1 << 20)
+
+    encoded = codec.encode(payload)
+    clean = codec.decode(encoded)
+    print(f"RS({codec.n},{codec.k}) clean round trip: {clean == payload}, "
+          f"encode {codec.encode_stats.megabytes_per_second:.1f} MB/s, "
+          f"decode {codec.decode_stats.megabytes_per_second:.1f} MB/s")
+
+    # A long burst plus scattered byte errors (about 1% of symbols)
+    corrupted = np.frombuffer(encoded, dtype=np.uint8).copy()
+    corrupted[1000:1000 + 2000] ^= 0xFF
+    hits = rng.choice(corrupted.size, corrupted.size // 100, replace=False)
+    corrupted[hits] ^= rng.integers(1, 256, hits.size, dtype=np.uint8)
+    codec.decode_stats = FECStats()
+    recovered = codec.decode(corrupted.tobytes())
+    stats = codec.decode_stats
+    print(f"1% symbol errors + 2000-byte burst: recovered {recovered == payload}, "
+          f"{stats.corrected_symbols} symbols corrected, {stats.failed_codewords} codewords failed, "
+          f"decode {stats.megabytes_per_second:.1f} MB/s")
@@ -0,0 +1,211 @@
+import time
+
+import numpy as np
+
+from Signal.Modem import ModemConfig, ModemStats, PRWNSequence
+
+
+class ReceiverConfig:
+    def __init__(self):
+        self.fft_size = 0                  # overlap-save FFT length, 0 to pick 4x the preamble length
+        self.detection_threshold = 40.0    # correlation peak power over mean power needed to lock
+
+
+class ChannelLock:
+    """Timing and carrier phase acquired on one channel."""
+
+    __slots__ = ("channel", "sample", "phase", "quality")
+
+    def __init__(self, channel: int, sample: int, phase: float, quality: float):
+        self.channel = channel
+        self.sample = sample      # absolute sample where the preamble starts
+        self.phase = phase        # carrier phase at the receiver, radians
+        self.quality = quality    # peak-to-mean correlation power
+
+    def __repr__(self) -> str:
+        return f"ChannelLock(channel={self.channel}, sample={self.sample}, phase={self.phase:.3f}, quality={self.quality:.1f})"
+
+
+class _ChannelState:
+    __slots__ = ("lock", "chips", "pending", "skip")
+
+    def __init__(self):
+        self.lock: ChannelLock | None = None
+        self.chips: PRWNSequence | None = None
+        self.pending = np.zeros(0, dtype=np.complex64)
+        self.skip = 0  # preamble samples still to discard before payload starts
+
+
+class PRWNReceiver:
+    """
+    Multi-channel receiver for PRWNModulator streams with unknown delay and
+    carrier phase (ModemConfig.preamble_bits must be set). Blocks of shape
+    (channels, samples) are mixed to complex baseband, then an overlap-save
+    FFT matched filter against the preamble's PRWN waveform searches every
+    still-unlocked channel in one batched transform. The correlation peak
+    gives the preamble start and carrier phase; from there each channel is
+    despread coherently with the continuing PRWN code.
+    """
+
+    def __init__(self, num_channels: int, config: ModemConfig, receiver_config: ReceiverConfig | None = None):
+        if config.preamble_bits <= 0 or config.preamble_bits % 8:
+            raise ValueError("PRWNReceiver needs a preamble (ModemConfig.preamble_bits, multiple of 8)")
+        self.config = config
+        self.receiver_config = receiver_config or ReceiverConfig()
+        self.num_channels = num_channels
+        self.stats = ModemStats()
+
+        # Matched filter: the preamble (all +1 bits) spread by the first PRWN chips
+        preamble_chips = PRWNSequence(config.seed).next_chips(config.preamble_bits * config.chips_per_bit)
+        reference = np.repeat(preamble_chips, config.samples_per_chip).astype(np.float32)
+        self._reference_length = reference.size
+        fft_size = self.receiver_config.fft_size or 1 << int(np.ceil(np.log2(4 * reference.size)))
+        if fft_size <= reference.size:
+            raise ValueError("fft_size must exceed the preamble length in samples")
+        self._fft_size = fft_size
+        self._step = fft_size - reference.size + 1  # valid outputs per overlap-save segment
+        self._filter = np.conj(np.fft.fft(reference, fft_size)).astype(np.complex64)
+
+        self._omega = 2.0 * np.pi * config.carrier_frequency / config.sample_rate
+        self._position = 0        # absolute index of the next input sample
+        self._search = np.zeros((num_channels, 0), dtype=np.complex64)
+        self._search_start = 0    # absolute index of _search[:, 0]
+        self._channels = [_ChannelState() for _ in range(num_channels)]
+
+    @property
+    def locks(self) -> list[ChannelLock | None]:
+        return [state.lock for state in self._channels]
+
+    def _mix(self, block: np.ndarray) -> np.ndarray:
+        n = np.arange(self._position, self._position + block.shape[1], dtype=np.float64)
+        if self._omega == 0.0:
+            return block.astype(np.complex64)
+        mixer = np.exp(-1j * self._omega * n).astype(np.complex64)
+        return block * mixer
+
+    def _acquire(self, baseband: np.ndarray):
+        unlocked = [k for k, state in enumerate(self._channels) if state.lock is None]
+        if not unlocked:
+            self._search = self._search[:, :0]
+            return
+        self._search = np.concatenate((self._search, baseband), axis=1)
+
+        threshold = self.receiver_config.detection_threshold
+        while self._search.shape[1] >= self._fft_size and unlocked:
+            segment = self._search[unlocked, :self._fft_size]
+            correlation = np.fft.ifft(np.fft.fft(segment, axis=1) * self._filter, axis=1)[:, :self._step]
+            power = correlation.real ** 2 + correlation.imag ** 2
+            peaks = power.argmax(axis=1)
+            peak_power = power[np.arange(len(unlocked)), peaks]
+            mean_power = power.mean(axis=1)
+
+            for row, channel in enumerate(unlocked):
+                if mean_power[row] > 0.0 and peak_power[row] > threshold * mean_power[row]:
+                    self._lock_channel(channel, int(peaks[row]), correlation[row, peaks[row]],
+                                       float(peak_power[row] / mean_power[row]))
+
+            self._search = self._search[:, self._step:]
+            self._search_start += self._step
+            unlocked = [k for k in unlocked if self._channels[k].lock is None]
+
+    def _lock_channel(self, channel: int, offset: int, peak: complex, quality: float):
+        config = self.config
+        state = self._channels[channel]
+        start = self._search_start + offset
+        state.lock = ChannelLock(channel, start, float(np.angle(peak)), quality)
+        state.chips = PRWNSequence(config.seed)
+        state.chips.next_chips(config.preamble_bits * config.chips_per_bit)
+
+        # Hand the buffered samples after the preamble over to the despreader
+        payload_start = start + self._reference_length
+        buffered = payload_start - self._search_start
+        if buffered < self._search.shape[1]:
+            state.pending = self._search[channel, buffered:].copy()
+        else:
+            state.skip = buffered - self._search.shape[1]
+
+    def _despread(self, state: _ChannelState) -> bytes:
+        config = self.config
+        samples_per_byte = 8 * config.samples_per_bit
+        usable = state.pending.size - state.pending.size % samples_per_byte
+        if usable == 0:
+            return b""
+        rotation = np.complex64(np.exp(-1j * state.lock.phase))
+        samples = (state.pending[:usable] * rotation).real
+        state.pending = state.pending[usable:]
+
+        chip_sums = samples.reshape(-1, config.samples_per_chip).sum(axis=1)
+        despread = chip_sums * state.chips.next_chips(chip_sums.size)
+        bits = despread.reshape(-1, config.chips_per_bit).sum(axis=1) > 0.0
+        return np.packbits(bits).tobytes()
+
+    def process_block(self, block: np.ndarray) -> list[bytes]:
+        """Consume (channels, samples) of received signal; returns newly decoded bytes per channel."""
+        start = time.perf_counter()
+        block = np.asarray(block, dtype=np.float32)
+        if block.ndim == 1:
+            block = block[np.newaxis, :]
+        if block.shape[0] != self.num_channels:
+            raise ValueError(f"Expected {self.num_channels} channels, got {block.shape[0]}")
+
+        baseband = self._mix(block)
+        already_locked = [state.lock is not None for state in self._channels]
+        self._acquire(baseband)
+        self._position += block.shape[1]
+
+        payloads = []
+        for channel, state in enumerate(self._channels):
+            if state.lock is None:
+                payloads.append(b"")
+                continue
+            if already_locked[channel]:
+                # Newly locked channels already took this block from the search buffer
+                incoming = baseband[channel]
+                if state.skip:
+                    skipped = min(state.skip, incoming.size)
+                    incoming = incoming[skipped:]
+                    state.skip -= skipped
+                state.pending = np.concatenate((state.pending, incoming)) if state.pending.size else incoming
+            payload = self._despread(state)
+            self.stats.bytes += len(payload)
+            payloads.append(payload)
+
+        self.stats.samples += block.size
+        self.stats.seconds += time.perf_counter() - start
+        return payloads
+
+    def realtime_factor(self) -> float:
+        """Signal seconds processed per wall-clock second, across all channels."""
+        signal_seconds = self.stats.samples / self.config.sample_rate
+        return signal_seconds / self.stats.seconds if self.stats.seconds > 0.0 else 0.0
+
+
+if __name__ == "__main__":
+    import os
+
+    from Signal.Modem import PRWNModulator
+
+    config = ModemConfig()
+    config.preamble_bits = 32
+    num_channels = 8
+    rng = np.random.default_rng(7)
+    payload = os.urandom(2048)
+
+    transmitted = np.concatenate(list(PRWNModulator(config).modulate([payload])))
+    delays = rng.integers(0, 20000, num_channels)
+    length = transmitted.size + int(delays.max()) + 8 * config.samples_per_bit
+    received = rng.normal(0.0, 1.0, (num_channels, length)).astype(np.float32)  # ~0 dB per-sample SNR
+    for channel, delay in enumerate(delays):
+        received[channel, delay:delay + transmitted.size] += rng.uniform(0.5, 1.5) * transmitted
+
+    receiver = PRWNReceiver(num_channels, config)
+    decoded = [bytearray() for _ in range(num_channels)]
+    for offset in range(0, length, 16384):
+        for channel, data in enumerate(receiver.process_block(received[:, offset:offset + 16384])):
+            decoded[channel] += data
+
+    for channel, lock in enumerate(receiver.locks):
+        ok = bytes(decoded[channel][:len(payload)]) == payload
+        print(f"channel {channel}: delay {delays[channel]:5d} -> {lock}, payload recovered: {ok}")
+    print(f"{receiver.stats.samples} samples over {num_channels} channels, "
+          f"{receiver.realtime_factor():.1f}x real time at {config.sample_rate:.0f} Hz")
@@ -0,0 +1,15 @@
+import os
+import sys
+
+import pytest
+
+# Tests import the prototype packages (Core, Debug, Signal) the way main.py does
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+
+@pytest.fixture(autouse=True, scope="session")
+def _log_directory(tmp_path_factory):
+    # Keep Log.log out of the checkout; logging reads SAW_LOG_DIR when it initializes
+    os.environ["SAW_LOG_DIR"] = str(tmp_path_factory.mktemp("logs"))
+    yield
+    os.environ.pop("SAW_LOG_DIR", None)
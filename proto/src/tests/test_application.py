@@ -0,0 +1,54 @@
+from Core.Application import Application, ApplicationSpecification, FrameStats
+from Core.Layer import Layer
+from Core.Log import Log
+
+
+class _StopAfter(Layer):
+    def __init__(self, application: Application, updates: int):
+        super().__init__("StopAfter")
+        self.application = application
+        self.remaining = updates
+
+    def on_update(self, ts):
+        self.remaining -= 1
+        if self.remaining <= 0:
+            self.application.close()
+
+
+def test_frame_stats_window_and_totals():
+    stats = FrameStats(capacity=4)
+    for frame_time in (0.001, 0.002, 0.003):
+        stats.record(frame_time)
+    stats.reset_window()
+    for frame_time in (0.004, 0.005):
+        stats.record(frame_time)
+
+    assert stats.window() == [0.004, 0.005]
+    assert stats.window_summary()["frames"] == 2
+    summary = stats.summary()
+    assert summary["frames"] == 5
+    assert summary["min"] == 0.001
+    assert summary["max"] == 0.005
+    assert abs(summary["avg"] - 0.003) < 1e-12
+
+
+def test_summary_after_run_covers_whole_run():
+    spec = ApplicationSpecification()
+    spec.simulation_rate = 2000.0
+    spec.stats_log_interval = 0.001  # reset the log window many times during the run
+    application = Application(spec)
+    application.push_layer(_StopAfter(application, 200))
+    application.run()
+
+    summary = application.frame_stats.summary()
+    assert summary["frames"] == application.frame_stats.frames > 0
+    assert summary["max"] >= summary["avg"] >= summary["min"] > 0.0
+
+
+def test_application_keeps_existing_logging_setup():
+    Log.init()
+    handlers = list(Log._handlers)
+    core_logger = Log.core_logger
+    Application()
+    assert Log._handlers == handlers
+    assert Log.core_logger is core_logger
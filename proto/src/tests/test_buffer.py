@@ -0,0 +1,57 @@
+import ctypes
+import struct
+import zlib
+
+from Core.Buffer import Buffer, BufferPool, ScopedBuffer
+from Core.HashCRC32 import Hash
+
+
+class _Sample(ctypes.Structure):
+    _fields_ = [("id", ctypes.c_uint32), ("value", ctypes.c_float)]
+
+
+def test_as_type_scalars():
+    buffer = Buffer(12)
+    buffer.data[:] = struct.pack("<3I", 1, 2, 3)
+    assert buffer.as_type(ctypes.c_uint32) == [1, 2, 3]
+
+
+def test_as_type_structures():
+    buffer = Buffer(2 * ctypes.sizeof(_Sample))
+    buffer.data[:] = struct.pack("<IfIf", 7, 0.5, 9, 1.5)
+    samples = buffer.as_type(_Sample)
+    assert [(s.id, s.value) for s in samples] == [(7, 0.5), (9, 1.5)]
+
+
+def test_crc_ignores_pooled_capacity():
+    pool = BufferPool()
+    payload = b"surface acoustic wave"
+    buffer = pool.acquire(len(payload))
+    assert buffer.capacity > buffer.size
+    buffer.data[:] = b"\xff" * buffer.capacity
+    buffer.data[:len(payload)] = payload
+    assert Hash.crc32_bytes(buffer) == zlib.crc32(payload)
+    with ScopedBuffer(buffer, pool) as scoped:
+        assert Hash.crc32_bytes(scoped) == zlib.crc32(payload)
+
+
+def test_allocate_zeroes_reused_storage():
+    buffer = Buffer(64)
+    buffer.data[:] = b"\xff" * 64
+    buffer.allocate(16)
+    assert buffer.size == 16
+    assert bytes(buffer.slice(0, 16)) == bytes(16)
+
+
+def test_scoped_buffer_returns_only_pool_storage():
+    pool = BufferPool()
+    with ScopedBuffer(100, pool):
+        pass
+    assert pool.free_bytes() == BufferPool.size_class(100)
+
+    pool.clear()
+    caller_buffer = Buffer(BufferPool.MIN_SIZE)
+    with ScopedBuffer(caller_buffer, pool):
+        pass
+    assert pool.free_bytes() == 0
+    assert not caller_buffer
@@ -0,0 +1,109 @@
+import os
+import resource
+
+import pytest
+
+from Core.DataTransfer import ChunkedTransfer, TransferError, TransferManifest
+from Core.HashCRC32 import CRC32
+
+CHUNK = 64 * 1024
+
+
+def _write(path, data: bytes):
+    with open(path, "wb") as f:
+        f.write(data)
+
+
+def _read(path) -> bytes:
+    with open(path, "rb") as f:
+        return f.read()
+
+
+def _interrupted_transfer(source, destination, fail_index: int) -> ChunkedTransfer:
+    # Copy every chunk except fail_index, leaving a manifest behind
+    engine = ChunkedTransfer(source, destination, chunk_size=CHUNK, num_workers=1)
+    transfer_chunk = engine._transfer_chunk
+
+    def failing(job, manifest, index):
+        if index == fail_index:
+            raise TransferError("interrupted")
+        return transfer_chunk(job, manifest, index)
+    engine._transfer_chunk = failing
+    with pytest.raises(TransferError):
+        engine.transfer()
+    assert os.path.exists(destination + TransferManifest.FILENAME)
+    return engine
+
+
+@pytest.fixture
+def payload(tmp_path):
+    data = os.urandom(5 * CHUNK + 123)
+    source = str(tmp_path / "source.bin")
+    _write(source, data)
+    return source, str(tmp_path / "destination.bin"), data
+
+
+def test_resume_skips_verified_chunks(payload):
+    source, destination, data = payload
+    _interrupted_transfer(source, destination, fail_index=5)
+
+    report = ChunkedTransfer(source, destination, chunk_size=CHUNK, num_workers=1).transfer()
+    assert _read(destination) == data
+    assert report.bytes_resumed == 5 * CHUNK
+    assert report.bytes_copied == len(data) - 5 * CHUNK
+    assert report.checksums["source.bin"] == CRC32(data).value
+
+
+def test_resume_recopies_deleted_destination(payload):
+    source, destination, data = payload
+    _interrupted_transfer(source, destination, fail_index=5)
+    os.remove(destination)
+
+    report = ChunkedTransfer(source, destination, chunk_size=CHUNK, num_workers=1).transfer()
+    assert _read(destination) == data
+    assert report.bytes_resumed == 0
+    assert report.checksums["source.bin"] == CRC32(data).value
+
+
+def test_resume_rechecks_corrupted_chunks(payload):
+    source, destination, data = payload
+    _interrupted_transfer(source, destination, fail_index=5)
+    # Corrupt chunk 1 in place; only the per-chunk CRC recheck can catch it
+    with open(destination, "r+b") as f:
+        f.seek(CHUNK + 10)
+        f.write(b"\x00" * 16)
+
+    report = ChunkedTransfer(source, destination, chunk_size=CHUNK, num_workers=1).transfer()
+    assert _read(destination) == data
+    assert report.bytes_resumed == 4 * CHUNK
+    assert report.checksums["source.bin"] == CRC32(data).value
+
+
+def test_resume_after_destination_written_past_last_save(payload):
+    source, destination, data = payload
+    _interrupted_transfer(source, destination, fail_index=5)
+    # A crash after the last manifest save leaves the destination newer than the manifest
+    stat = os.stat(destination)
+    os.utime(destination, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+
+    report = ChunkedTransfer(source, destination, chunk_size=CHUNK, num_workers=1).transfer()
+    assert _read(destination) == data
+    assert report.bytes_resumed == 5 * CHUNK
+
+
+def test_open_files_bounded_by_workers(tmp_path):
+    source = tmp_path / "tree"
+    source.mkdir()
+    for i in range(300):
+        _write(source / f"file{i:03d}.bin", os.urandom(1000 + i))
+    (source / "empty.bin").touch()
+
+    soft, hard = resource.getrlimit(resource.RLIMIT_NOFILE)
+    resource.setrlimit(resource.RLIMIT_NOFILE, (min(256, hard), hard))
+    try:
+        report = ChunkedTransfer(str(source), str(tmp_path / "copy"), chunk_size=CHUNK, num_workers=4).transfer()
+    finally:
+        resource.setrlimit(resource.RLIMIT_NOFILE, (soft, hard))
+    assert report.files == 301
+    assert _read(tmp_path / "copy" / "file299.bin") == _read(source / "file299.bin")
+    assert (tmp_path / "copy" / "empty.bin").exists()
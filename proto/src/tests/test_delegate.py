@@ -0,0 +1,84 @@
+import gc
+
+from Core.Delegate import MulticastDelegate
+
+
+class _Listener:
+    def __init__(self):
+        self.calls = []
+
+    def on_event(self, value):
+        self.calls.append(value)
+
+
+class _UnhashableCallable:
+    def __init__(self):
+        self.calls = []
+
+    def __eq__(self, other):
+        return isinstance(other, _UnhashableCallable)
+
+    def __call__(self, value):
+        self.calls.append(value)
+
+
+def test_bind_is_idempotent_and_unbinds_by_callback():
+    delegate = MulticastDelegate()
+    listener = _Listener()
+    handle = delegate.bind(listener.on_event)
+    assert delegate.bind(listener.on_event) == handle
+    delegate.invoke(1)
+    delegate.unbind(listener.on_event)
+    assert not delegate
+    assert listener.calls == [1]
+
+
+def test_unhashable_callables_bind_by_identity():
+    delegate = MulticastDelegate()
+    first, second = _UnhashableCallable(), _UnhashableCallable()
+    assert first == second
+    assert delegate.bind(first) != delegate.bind(second)
+    assert delegate.bind(first) == delegate.bind(first)
+    delegate.invoke(3)
+    delegate.unbind(first)
+    delegate.invoke(4)
+    assert first.calls == [3]
+    assert second.calls == [3, 4]
+
+
+def test_weak_bindings_unbind_by_callback_and_on_death():
+    delegate = MulticastDelegate()
+    kept, dropped = _Listener(), _Listener()
+    delegate.bind(kept.on_event, weak=True)
+    delegate.bind(dropped.on_event, weak=True)
+    assert len(delegate) == 2
+
+    delegate.unbind(kept.on_event)
+    assert len(delegate) == 1
+    del dropped
+    gc.collect()
+    assert len(delegate) == 0
+
+
+def test_weak_lambda_and_callable_object_are_collected():
+    delegate = MulticastDelegate()
+    calls = []
+    callback = lambda value: calls.append(("lambda", value))  # noqa: E731
+    instance = _UnhashableCallable()
+
+    class _HashableCallable:
+        def __call__(self, value):
+            calls.append(("object", value))
+
+    callable_object = _HashableCallable()
+    delegate.bind(callback, weak=True)
+    delegate.bind(callable_object, weak=True)
+    delegate.bind(instance, weak=True)
+    assert delegate.bind(callback, weak=True) == delegate.bind(callback)
+    delegate.invoke(1)
+    assert calls == [("lambda", 1), ("object", 1)]
+
+    del callback, callable_object, instance
+    gc.collect()
+    assert len(delegate) == 0
+    assert not delegate._handles and not delegate._keys
@@ -0,0 +1,19 @@
+import numpy as np
+
+from Core.FastRandom import FastRandom
+
+
+def test_bulk_matches_scalar():
+    scalar, bulk = FastRandom(1234), FastRandom(1234)
+    expected = [scalar.get_int32_in_range(-5, 20) for _ in range(1000)]
+    assert bulk.get_int32_in_range_array(1000, -5, 20).tolist() == expected
+    assert bulk.state == scalar.state
+
+
+def test_empty_range_draws_nothing():
+    scalar, bulk = FastRandom(99), FastRandom(99)
+    assert scalar.get_int32_in_range(7, 7) == 7
+    values = bulk.get_int32_in_range_array(16, 7, 7)
+    assert values.tolist() == [7] * 16
+    assert bulk.state == scalar.state
+    assert values.dtype == bulk.get_int32_in_range_array(4, 0, 10).dtype == np.int64
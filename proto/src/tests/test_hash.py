@@ -0,0 +1,14 @@
+import pytest
+
+from Core.Hash import Hash
+
+
+def test_fnv_hash_array_matches_scalar():
+    names = ["", "a", "abc", "Surface Acoustic Wave", "ünïcødé"]
+    assert Hash.generate_fnv_hash_array(names).tolist() == [Hash.generate_fnv_hash(name) for name in names]
+    assert Hash.generate_fnv_hash_array([]).tolist() == []
+
+
+def test_fnv_hash_array_rejects_bare_string():
+    with pytest.raises(TypeError):
+        Hash.generate_fnv_hash_array("abc")
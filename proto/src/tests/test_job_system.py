@@ -0,0 +1,30 @@
+import pytest
+
+from Core.JobSystem import JobFuture, JobSystem
+
+
+@pytest.fixture
+def jobs():
+    system = JobSystem(num_workers=2)
+    yield system
+    system.shutdown()
+
+
+def test_dependencies_and_parallel_for(jobs):
+    first = jobs.submit(lambda: 2)
+    second = jobs.submit(lambda: 3)
+    total = jobs.submit(lambda: first.result() * second.result(), depends_on=(first, second))
+    assert total.result(timeout=5.0) == 6
+    assert sum(jobs.parallel_for(100, lambda start, stop: sum(range(start, stop)))) == sum(range(100))
+
+
+def test_wait_on_worker_thread_honours_timeout(jobs):
+    never = JobFuture(jobs)
+
+    def wait_on_worker():
+        assert jobs.is_worker_thread()
+        with pytest.raises(TimeoutError):
+            never.result(timeout=0.05)
+        return never.wait(timeout=0.0)
+
+    assert jobs.submit(wait_on_worker).result(timeout=5.0) is False
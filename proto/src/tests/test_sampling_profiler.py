@@ -0,0 +1,69 @@
+import threading
+
+import pytest
+
+from Debug.Profiler import Profiler, SAW_ENABLE_PROFILING, SAW_PROFILE_SCOPE, SAW_PROFILE_THREAD
+from Debug.SamplingProfiler import SamplingProfiler
+
+pytestmark = pytest.mark.skipif(not SAW_ENABLE_PROFILING, reason="profiling disabled (SAW_DIST=1)")
+
+
+def _run_in_thread(target):
+    thread = threading.Thread(target=target)
+    thread.start()
+    thread.join()
+    return thread
+
+
+def test_only_opted_in_live_threads_are_sampled():
+    ready, release = threading.Event(), threading.Event()
+
+    def opted_in():
+        SAW_PROFILE_THREAD("Sampled Worker")
+        ready.set()
+        release.wait()
+
+    def zone_only():
+        with SAW_PROFILE_SCOPE("zone_only"):
+            pass
+
+    worker = threading.Thread(target=opted_in)
+    worker.start()
+    ready.wait()
+    zone_thread = _run_in_thread(zone_only)
+    try:
+        targets = SamplingProfiler()._targets()
+        assert targets.get(worker.ident) == "Sampled Worker"
+        assert zone_thread.ident in Profiler.thread_names()
+        assert zone_thread.ident not in targets
+    finally:
+        release.set()
+        worker.join()
+
+    assert worker.ident not in Profiler.profiled_threads()
+
+
+def test_exited_threads_release_their_ring_buffers():
+    def zones(count, buffers):
+        def run():
+            for _ in range(count):
+                with SAW_PROFILE_SCOPE("short_lived"):
+                    pass
+            buffers.append(Profiler.get_thread_buffer())
+        return run
+
+    idle, busy = [], []
+    _run_in_thread(zones(0, idle))
+    _run_in_thread(zones(3, busy))
+
+    with Profiler._lock:
+        assert idle[0] not in Profiler._buffers
+        assert busy[0] in Profiler._buffers
+    assert len(busy[0].names) == busy[0].count == 3
+    assert [zone[0] for zone in busy[0].zones()] == ["short_lived"] * 3
+
+    for _ in range(4):
+        _run_in_thread(zones(Profiler.RETIRED_CAPACITY // 2, []))
+    with Profiler._lock:
+        assert Profiler._retired_zones <= Profiler.RETIRED_CAPACITY
+        assert sum(buffer.count for buffer in Profiler._retired) == Profiler._retired_zones
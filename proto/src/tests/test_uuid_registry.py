@@ -0,0 +1,57 @@
+import numpy as np
+import pytest
+
+from Core.UUID import UUID, UUIDRegistry
+
+RECORD = np.dtype([("x", np.float32), ("y", np.float32)])
+
+
+def test_single_adds_are_found_after_merge():
+    registry = UUIDRegistry(RECORD, capacity=4)
+    keys = UUID.generate_array(1000)
+    rows = [registry.add(int(key), (i, -i)) for i, key in enumerate(keys)]
+    assert rows == list(range(1000))
+    assert registry.find_rows(keys).tolist() == rows
+    assert registry.get(int(keys[10]))["x"] == 10.0
+    assert UUID(int(keys[20])) in registry
+    assert UUID(12345) not in registry
+
+
+def test_duplicates_rejected_before_and_after_merge():
+    registry = UUIDRegistry(RECORD)
+    registry.add(7)
+    with pytest.raises(ValueError):
+        registry.add(7)  # still pending
+    assert registry.find_row(7) == 0
+    with pytest.raises(ValueError):
+        registry.add(7)  # merged into the index
+    with pytest.raises(ValueError):
+        registry.add_many([8, 9, 9])
+
+    registry.add(10)
+    with pytest.raises(ValueError):
+        registry.add_many([11, 10])  # collides with a pending add
+    rows = registry.add_many([12, 11])
+    assert registry.find_rows([10, 11, 12, 13]).tolist() == [1, rows[1], rows[0], -1]
+    assert len(registry) == 4
+
+
+def test_zero_capacity_grows():
+    registry = UUIDRegistry(RECORD, capacity=0)
+    assert registry.add(5) == 0
+    assert registry.add_many([6, 7]).tolist() == [1, 2]
+    assert registry.find_row(7) == 2
+
+
+def test_keys_must_fit_key_width():
+    registry = UUIDRegistry(RECORD, bits=32)
+    with pytest.raises(ValueError):
+        registry.add(1 << 32)
+    with pytest.raises(ValueError):
+        registry.add(-1)
+    with pytest.raises(ValueError):
+        registry.add_many(np.array([1, 1 << 40], dtype=np.uint64))
+    with pytest.raises(ValueError):
+        registry.add(UUID(bits=64).value | (1 << 63))
+    assert registry.add((1 << 32) - 1) == 0
+    assert len(registry) == 1
@@ -0,0 +1,45 @@
+import copy
+import pickle
+
+import pytest
+
+from Core.Identifier import Identifier
+from Core.Timestep import Timestep
+from Core.UUID import UUID
+
+
+def _round_trips(value):
+    return [pickle.loads(pickle.dumps(value)), copy.copy(value), copy.deepcopy(value)]
+
+
+def test_uuid_pickle_and_copy():
+    for uuid in (UUID(), UUID(bits=32)):
+        for clone in _round_trips(uuid):
+            assert clone == uuid
+            assert clone.bits == uuid.bits
+
+
+def test_timestep_pickle_and_copy():
+    step = Timestep(0.016)
+    for clone in _round_trips(step):
+        assert clone.time == step.time
+
+
+def test_identifier_pickle_and_copy_reinterns():
+    name = Identifier("test_identifier_pickle")
+    for clone in _round_trips(name):
+        assert clone is name
+
+    anonymous = Identifier(0x1234ABCD)
+    for clone in _round_trips(anonymous):
+        assert clone == anonymous
+        assert clone.dbg_name == ""
+
+
+def test_value_types_stay_immutable():
+    with pytest.raises(AttributeError):
+        UUID().value = 1
+    with pytest.raises(AttributeError):
+        Timestep(1.0).time = 2.0
+    with pytest.raises(AttributeError):
+        Identifier("test_identifier_immutable").hash = 0
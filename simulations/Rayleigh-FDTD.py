@@ -0,0 +1,251 @@
+import math
+import multiprocessing as mp
+import time
+from multiprocessing import shared_memory
+
+import numpy as np
+
+from SimulationLoader import LoadSimulation
+
+RayleighSAW = LoadSimulation("Rayleigh-SAW")
+MaterialProperties = RayleighSAW.MaterialProperties
+SimulationContext = RayleighSAW.SimulationContext
+
+# Isotropic elastic constants and wave speeds derived from MaterialProperties
+class ElasticProperties:
+    def __init__(self, material: MaterialProperties):
+        E = material.elasticModulus
+        nu = material.poissonRatio
+        self.density = material.density
+
+        # Lame parameters
+        self.mu = E / (2.0 * (1.0 + nu))
+        self.lam = E * nu / ((1.0 + nu) * (1.0 - 2.0 * nu))
+
+        self.pWaveSpeed = math.sqrt((self.lam + 2.0 * self.mu) / self.density)
+        self.sWaveSpeed = math.sqrt(self.mu / self.density)
+        # Viktorov's approximation to the Rayleigh equation root
+        self.rayleighWaveSpeed = self.sWaveSpeed * (0.862 + 1.14 * nu) / (1.0 + nu)
+
+    def __repr__(self) -> str:
+        return (f"ElasticProperties(vp={self.pWaveSpeed:.1f} m/s, vs={self.sWaveSpeed:.1f} m/s, "
+                f"vr={self.rayleighWaveSpeed:.1f} m/s)")
+
+# Solver configuration for a 2D P-SV section through the substrate (x along the
+# surface, z into the depth). Row 1 is the free surface.
+class FDTDConfig:
+    def __init__(self):
+        self.numCellsX = 600
+        self.numCellsZ = 200
+        self.frequency = 20000.0          # source centre frequency (Hz)
+        self.cellsPerWavelength = 20.0    # resolution of the Rayleigh wavelength
+        self.courant = 0.5                # vp * dt / dx, stable below 1/sqrt(2)
+        self.duration = 1.0e-3            # simulated time (s)
+        self.sourceX = 100                # source column at the surface
+        self.sourceAmplitude = 1.0e3      # line force (N/m)
+        self.spongeWidth = 40             # absorbing cells on left/right/bottom
+        self.spongeStrength = 0.015
+        self.recordEvery = 4              # steps between surface trace samples
+        self.numWorkers = 1               # tiles along x, one process each
+
+    @staticmethod
+    def FromContext(context: SimulationContext) -> "FDTDConfig":
+        config = FDTDConfig()
+        config.frequency = context.frequency * context.pitch
+        return config
+
+class FDTDResult:
+    def __init__(self):
+        self.elastic = None
+        self.dx = 0.0
+        self.dt = 0.0
+        self.numSteps = 0
+        self.times = None         # (numRecords,)
+        self.x = None             # (numCellsX,)
+        self.surfaceVz = None     # (numRecords, numCellsX) vertical surface velocity
+        self.fields = None        # name -> final (numCellsZ, numCellsX) field
+        self.wallTime = 0.0
+
+FIELD_NAMES = ("vx", "vz", "sxx", "szz", "sxz")
+
+def GridSpacing(config: FDTDConfig, elastic: ElasticProperties) -> tuple:
+    dx = elastic.rayleighWaveSpeed / config.frequency / config.cellsPerWavelength
+    dt = config.courant * dx / elastic.pWaveSpeed
+    return dx, dt
+
+def NumSteps(config: FDTDConfig, dt: float) -> int:
+    return int(math.ceil(config.duration / dt))
+
+def NumRecords(config: FDTDConfig, numSteps: int) -> int:
+    return numSteps // config.recordEvery
+
+# Cerjan-style taper applied every step on the left, right and bottom edges
+def SpongeProfile(config: FDTDConfig) -> np.ndarray:
+    nx, nz, width = config.numCellsX, config.numCellsZ, config.spongeWidth
+    distance = np.arange(width, dtype=np.float64)
+    taper = np.exp(-(config.spongeStrength * (width - distance)) ** 2)
+
+    profileX = np.ones(nx)
+    profileX[:width] = taper
+    profileX[nx - width:] = taper[::-1]
+    profileZ = np.ones(nz)
+    profileZ[nz - width:] = taper[::-1]
+    return np.outer(profileZ, profileX)
+
+def RickerWavelet(t: float, frequency: float) -> float:
+    a = (math.pi * frequency * (t - 1.5 / frequency)) ** 2
+    return (1.0 - 2.0 * a) * math.exp(-a)
+
+def _MapBuffers(buffer, config: FDTDConfig, numRecords: int):
+    shape = (len(FIELD_NAMES), config.numCellsZ, config.numCellsX)
+    fields = np.ndarray(shape, dtype=np.float64, buffer=buffer)
+    traces = np.ndarray((numRecords, config.numCellsX), dtype=np.float64, buffer=buffer,
+                        offset=fields.nbytes)
+    return fields, traces
+
+def _BufferSize(config: FDTDConfig, numRecords: int) -> int:
+    cells = config.numCellsZ * config.numCellsX
+    return 8 * (len(FIELD_NAMES) * cells + numRecords * config.numCellsX)
+
+# Advance the columns [j0, j1) of the shared fields through the whole run.
+# Neighbouring tiles read each other's edge column (the one-cell halo) directly
+# from the shared arrays; `sync` is a barrier between the velocity and stress
+# half-steps so a halo is never read while its owner is writing it.
+def _RunTile(fields: np.ndarray, traces: np.ndarray, config: FDTDConfig,
+             elastic: ElasticProperties, j0: int, j1: int, sync):
+    vx, vz, sxx, szz, sxz = fields
+    dx, dt = GridSpacing(config, elastic)
+    dz = dx
+    numSteps = NumSteps(config, dt)
+    sponge = SpongeProfile(config)[:, j0:j1]
+
+    lam, mu = elastic.lam, elastic.mu
+    lam2mu = lam + 2.0 * mu
+    b = dt / elastic.density
+
+    I = slice(1, config.numCellsZ - 1)
+    Im = slice(0, config.numCellsZ - 2)
+    Ip = slice(2, config.numCellsZ)
+    J = slice(j0, j1)
+    Jm = slice(j0 - 1, j1 - 1)
+    Jp = slice(j0 + 1, j1 + 1)
+
+    ownsSource = j0 <= config.sourceX < j1
+    sourceScale = dt * config.sourceAmplitude / (elastic.density * dx * dz)
+
+    for step in range(numSteps):
+        # Velocity half-step (reads stresses, including the halo column)
+        vx[I, J] += b * ((sxx[I, J] - sxx[I, Jm]) / dx + (sxz[I, J] - sxz[Im, J]) / dz)
+        vz[I, J] += b * ((sxz[I, Jp] - sxz[I, J]) / dx + (szz[Ip, J] - szz[I, J]) / dz)
+        if ownsSource:
+            vz[1, config.sourceX] += sourceScale * RickerWavelet(step * dt, config.frequency)
+        vx[:, J] *= sponge
+        vz[:, J] *= sponge
+        sync()
+
+        # Stress half-step (reads velocities, including the halo column)
+        dvxdx = (vx[I, Jp] - vx[I, J]) / dx
+        dvzdz = (vz[I, J] - vz[Im, J]) / dz
+        sxx[I, J] += dt * (lam2mu * dvxdx + lam * dvzdz)
+        szz[I, J] += dt * (lam * dvxdx + lam2mu * dvzdz)
+        sxz[I, J] += (dt * mu) * ((vx[Ip, J] - vx[I, J]) / dz + (vz[I, J] - vz[I, Jm]) / dx)
+
+        # Traction-free surface by stress imaging about row 1
+        szz[1, J] = 0.0
+        szz[0, J] = -szz[2, J]
+        sxz[0, J] = -sxz[1, J]
+
+        sxx[:, J] *= sponge
+        szz[:, J] *= sponge
+        sxz[:, J] *= sponge
+
+        if step % config.recordEvery == 0 and step // config.recordEvery < traces.shape[0]:
+            traces[step // config.recordEvery, J] = vz[1, J]
+        sync()
+
+def _TileWorker(shmName: str, config: FDTDConfig, elastic: ElasticProperties,
+                numRecords: int, j0: int, j1: int, barrier):
+    shm = shared_memory.SharedMemory(name=shmName)
+    try:
+        fields, traces = _MapBuffers(shm.buf, config, numRecords)
+        _RunTile(fields, traces, config, elastic, j0, j1, barrier.wait)
+        del fields, traces
+    finally:
+        shm.close()
+
+# Split the interior columns into numWorkers contiguous tiles
+def TileBounds(config: FDTDConfig) -> list:
+    edges = np.linspace(1, config.numCellsX - 1, config.numWorkers + 1).round().astype(int)
+    return [(int(edges[i]), int(edges[i + 1])) for i in range(config.numWorkers) if edges[i + 1] > edges[i]]
+
+def RunFDTD(material: MaterialProperties, config: FDTDConfig) -> FDTDResult:
+    elastic = ElasticProperties(material)
+    dx, dt = GridSpacing(config, elastic)
+    numSteps = NumSteps(config, dt)
+    numRecords = NumRecords(config, numSteps)
+
+    if not (0 < config.sourceX < config.numCellsX - 1):
+        raise ValueError("sourceX must be an interior column")
+
+    start = time.perf_counter()
+    shm = shared_memory.SharedMemory(create=True, size=max(_BufferSize(config, numRecords), 1))
+    try:
+        fields, traces = _MapBuffers(shm.buf, config, numRecords)
+        fields.fill(0.0)
+        traces.fill(0.0)
+
+        tiles = TileBounds(config)
+        if len(tiles) == 1:
+            _RunTile(fields, traces, config, elastic, tiles[0][0], tiles[0][1], lambda: None)
+        else:
+            barrier = mp.Barrier(len(tiles))
+            workers = [mp.Process(target=_TileWorker, name=f"FDTD-Tile{i}",
+                                  args=(shm.name, config, elastic, numRecords, j0, j1, barrier))
+                       for i, (j0, j1) in enumerate(tiles)]
+            for worker in workers:
+                worker.start()
+            for worker in workers:
+                worker.join()
+            failed = [w.name for w in workers if w.exitcode != 0]
+            if failed:
+                raise RuntimeError(f"FDTD tile workers failed: {', '.join(failed)}")
+
+        result = FDTDResult()
+        result.elastic = elastic
+        result.dx = dx
+        result.dt = dt
+        result.numSteps = numSteps
+        result.times = np.arange(numRecords) * (config.recordEvery * dt)
+        result.x = np.arange(config.numCellsX) * dx
+        result.surfaceVz = traces.copy()
+        result.fields = {name: fields[i].copy() for i, name in enumerate(FIELD_NAMES)}
+        result.wallTime = time.perf_counter() - start
+        del fields, traces
+    finally:
+        shm.close()
+        shm.unlink()
+    return result
+
+# Surface-wave speed measured from the envelope peak arrival at two receivers
+def MeasureSurfaceWaveSpeed(result: FDTDResult, receiverA: int, receiverB: int) -> float:
+    arrivalA = result.times[np.argmax(np.abs(result.surfaceVz[:, receiverA]))]
+    arrivalB = result.times[np.argmax(np.abs(result.surfaceVz[:, receiverB]))]
+    if arrivalB == arrivalA:
+        return float("inf")
+    return abs(result.x[receiverB] - result.x[receiverA]) / abs(arrivalB - arrivalA)
+
+if __name__ == "__main__":
+    material = MaterialProperties()
+    config = FDTDConfig.FromContext(SimulationContext())
+    config.numWorkers = max(1, min(4, mp.cpu_count()))
+
+    result = RunFDTD(material, config)
+    print(result.elastic)
+    print(f"Grid {config.numCellsX}x{config.numCellsZ}, dx={result.dx * 1e3:.3f} mm, "
+          f"dt={result.dt * 1e9:.1f} ns, {result.numSteps} steps on {config.numWorkers} worker(s) "
+          f"in {result.wallTime:.2f} s")
+
+    receiverA, receiverB = config.sourceX + 100, config.sourceX + 250
+    measured = MeasureSurfaceWaveSpeed(result, receiverA, receiverB)
+    print(f"Measured surface wave speed {measured:.1f} m/s "
+          f"(Rayleigh estimate {result.elastic.rayleighWaveSpeed:.1f} m/s)")
@@ -1,3 +1,4 @@
+import copy
 import math
 import time
 import numpy as np
@@ -35,13 +36,92 @@ class SimulationContext:
         self.vertices = np.zeros(self.numPointsX * self.numPointsY * 7)
         self.decayZ = 0.2  # decay along y
 
+        # Compact structure-of-arrays storage (PropagationMode.Compact)
+        self.useFloat32 = False
+        self.storage = None
+
+        # Cached x/y factors for PropagationMode.Cached and StepWave
+        self.spatialCache = None
+
+# Structure-of-arrays vertex storage: x/y/z live in one contiguous (3, ny, nx)
+# block and the grid-wide parameters are stored once instead of per vertex
+class VertexStorage:
+    FIELDS = ("x", "y", "z", "amplitude", "frequency", "pitch", "wavelength")
+
+    def __init__(self, numPointsX: int, numPointsY: int, dtype=np.float64):
+        self.numPointsX = numPointsX
+        self.numPointsY = numPointsY
+        self.dtype = np.dtype(dtype)
+
+        self.positions = np.zeros((3, numPointsY, numPointsX), dtype=self.dtype)
+        self.x, self.y, self.z = self.positions  # contiguous (ny, nx) planes
+
+        self.amplitude = 0.0
+        self.frequency = 0.0
+        self.pitch = 0.0
+        self.wavelength = 0.0
+
+        self._interleaved = None
+
+    def Matches(self, numPointsX: int, numPointsY: int, dtype) -> bool:
+        return (self.numPointsX == numPointsX and self.numPointsY == numPointsY
+                and self.dtype == np.dtype(dtype))
+
+    def SetParameters(self, context: SimulationContext):
+        self.amplitude = context.amplitude
+        self.frequency = context.frequency
+        self.pitch = context.pitch
+        self.wavelength = context.wavelength
+
+    @property
+    def nbytes(self) -> int:
+        return self.positions.nbytes + 4 * self.dtype.itemsize
+
+    @property
+    def vertexDtype(self) -> np.dtype:
+        # Record layout of the legacy interleaved buffer (7 floats per vertex)
+        return np.dtype([(name, self.dtype) for name in VertexStorage.FIELDS])
+
+    def Fields(self) -> dict:
+        """
+        Zero-copy (ny, nx) views of all seven vertex fields. The per-grid
+        parameters are stride-0 broadcast views and are read-only.
+        """
+        shape = (self.numPointsY, self.numPointsX)
+        fields = {"x": self.x, "y": self.y, "z": self.z}
+        for name in VertexStorage.FIELDS[3:]:
+            fields[name] = np.broadcast_to(np.asarray(getattr(self, name), dtype=self.dtype), shape)
+        return fields
+
+    def PackInterleaved(self, out: np.ndarray = None) -> np.ndarray:
+        """
+        Pack into the 7-float interleaved layout for consumers that need it.
+        Returns a structured (ny, nx) array; `.view(dtype).reshape(-1)` gives the
+        flat buffer PropagateWave writes. The output is reused between calls.
+        """
+        shape = (self.numPointsY, self.numPointsX)
+        if out is None:
+            if self._interleaved is None or self._interleaved.shape != shape:
+                self._interleaved = np.empty(shape, dtype=self.vertexDtype)
+            out = self._interleaved
+        for name, view in self.Fields().items():
+            out[name] = view
+        return out
+
 # Wave type enum equivalent
 class WaveType:
     Single = 1
     CounterPropagating = 2
 
-# Propagate wave (single or counter-propagating)
-def PropagateWave(context: SimulationContext, time_val: float, waveType: int):
+# Propagation engine selection
+class PropagationMode:
+    Scalar = 1      # per-vertex reference loop
+    Vectorized = 2  # broadcast NumPy implementation
+    Compact = 3     # broadcast implementation writing context.storage
+    Cached = 4      # cached spatial factors, one outer product per frame
+
+# Reference implementation: one math.sin/math.exp per vertex
+def PropagateWaveScalar(context: SimulationContext, time_val: float, waveType: int):
     nx = context.numPointsX
     ny = context.numPointsY
     k = 2.0 * PI / context.wavelength
@@ -73,6 +153,239 @@ def PropagateWave(context: SimulationContext, time_val: float, waveType: int):
             context.vertices[idx + 5] = context.pitch
             context.vertices[idx + 6] = context.wavelength
 
+# Broadcast implementation: z only depends on x (and time) times a y-only decay,
+# so the transcendentals are evaluated once per column/row and combined with an
+# outer product. Operation order matches the scalar path term by term.
+def PropagateWaveVectorized(context: SimulationContext, time_val: float, waveType: int):
+    nx = context.numPointsX
+    ny = context.numPointsY
+    k = 2.0 * PI / context.wavelength
+    omega = 2.0 * PI * context.frequency * context.pitch
+
+    if context.vertices.size != nx * ny * 7:
+        context.vertices = np.zeros(nx * ny * 7)
+
+    x = np.arange(nx, dtype=np.float64) / nx * context.domainLengthX
+    y = np.arange(ny, dtype=np.float64) / ny * context.domainLengthY
+
+    if waveType == WaveType.Single:
+        zx = context.amplitude * np.sin(k * x - omega * time_val)
+    else:
+        forwardZ = context.amplitude * np.sin(k * x - omega * time_val)
+        backwardZ = context.amplitude * np.sin(k * x + omega * time_val)
+        zx = forwardZ + backwardZ
+
+    decayY = np.exp(-context.decayZ * y)
+
+    # Interleaved layout: vertex (ix, iy) lives at 7 * (iy * nx + ix)
+    grid = context.vertices.reshape(ny, nx, 7)
+    grid[:, :, 0] = x[np.newaxis, :]
+    grid[:, :, 1] = y[:, np.newaxis]
+    np.multiply(zx[np.newaxis, :], decayY[:, np.newaxis], out=grid[:, :, 2])
+    grid[:, :, 3] = context.amplitude
+    grid[:, :, 4] = context.frequency
+    grid[:, :, 5] = context.pitch
+    grid[:, :, 6] = context.wavelength
+
+# Return the context's compact storage, reallocating it if the grid or precision changed
+def GetVertexStorage(context: SimulationContext) -> VertexStorage:
+    dtype = np.float32 if context.useFloat32 else np.float64
+    if context.storage is None or not context.storage.Matches(context.numPointsX, context.numPointsY, dtype):
+        context.storage = VertexStorage(context.numPointsX, context.numPointsY, dtype)
+    return context.storage
+
+# Same evaluation as PropagateWaveVectorized, but only x/y/z are written per
+# vertex; the interleaved context.vertices buffer is left untouched
+def PropagateWaveCompact(context: SimulationContext, time_val: float, waveType: int):
+    nx = context.numPointsX
+    ny = context.numPointsY
+    k = 2.0 * PI / context.wavelength
+    omega = 2.0 * PI * context.frequency * context.pitch
+    storage = GetVertexStorage(context)
+
+    x = np.arange(nx, dtype=np.float64) / nx * context.domainLengthX
+    y = np.arange(ny, dtype=np.float64) / ny * context.domainLengthY
+
+    if waveType == WaveType.Single:
+        zx = context.amplitude * np.sin(k * x - omega * time_val)
+    else:
+        forwardZ = context.amplitude * np.sin(k * x - omega * time_val)
+        backwardZ = context.amplitude * np.sin(k * x + omega * time_val)
+        zx = forwardZ + backwardZ
+
+    decayY = np.exp(-context.decayZ * y)
+
+    storage.x[:] = x[np.newaxis, :]
+    storage.y[:] = y[:, np.newaxis]
+    np.multiply(zx[np.newaxis, :], decayY[:, np.newaxis], out=storage.z, casting="same_kind")
+    storage.SetParameters(context)
+
+# Everything the spatial factors depend on; a change in any of these rebuilds the cache
+def SpatialCacheKey(context: SimulationContext) -> tuple:
+    return (context.numPointsX, context.numPointsY, context.domainLengthX,
+            context.domainLengthY, context.wavelength, context.decayZ)
+
+# Separable spatial factors of the analytic wave. Using
+#   sin(kx - wt) = sin(kx)cos(wt) - cos(kx)sin(wt)
+#   sin(kx - wt) + sin(kx + wt) = 2 sin(kx)cos(wt)
+# a frame only needs cos(wt)/sin(wt), which StepWave advances by rotation.
+class SpatialCache:
+    def __init__(self, context: SimulationContext):
+        nx = context.numPointsX
+        ny = context.numPointsY
+        k = 2.0 * PI / context.wavelength
+
+        self.key = SpatialCacheKey(context)
+        self.x = np.arange(nx, dtype=np.float64) / nx * context.domainLengthX
+        self.y = np.arange(ny, dtype=np.float64) / ny * context.domainLengthY
+        self.sinKX = np.sin(k * self.x)
+        self.cosKX = np.cos(k * self.x)
+        self.decayY = np.exp(-context.decayZ * self.y)
+
+        # Storage whose x/y planes already hold this grid
+        self.storage = None
+
+        # Temporal phasor state
+        self.omega = None
+        self.time = 0.0
+        self.cosWT = 1.0
+        self.sinWT = 0.0
+        self.rotorStep = None
+        self.rotorCos = 1.0
+        self.rotorSin = 0.0
+
+    def SetPhase(self, omega: float, time_val: float):
+        self.omega = omega
+        self.time = time_val
+        self.cosWT = math.cos(omega * time_val)
+        self.sinWT = math.sin(omega * time_val)
+
+    def Rotate(self, dt: float):
+        if self.rotorStep != (self.omega, dt):
+            self.rotorStep = (self.omega, dt)
+            self.rotorCos = math.cos(self.omega * dt)
+            self.rotorSin = math.sin(self.omega * dt)
+
+        c = self.cosWT * self.rotorCos - self.sinWT * self.rotorSin
+        s = self.sinWT * self.rotorCos + self.cosWT * self.rotorSin
+        # Renormalise so rounding error doesn't grow the amplitude over long runs
+        norm = math.hypot(c, s)
+        self.cosWT = c / norm
+        self.sinWT = s / norm
+        self.time += dt
+
+def InvalidateSpatialCache(context: SimulationContext):
+    context.spatialCache = None
+
+# Return the context's spatial cache, rebuilding it if a spatial parameter changed
+def GetSpatialCache(context: SimulationContext) -> SpatialCache:
+    if context.spatialCache is None or context.spatialCache.key != SpatialCacheKey(context):
+        context.spatialCache = SpatialCache(context)
+    return context.spatialCache
+
+def _WriteCachedFrame(context: SimulationContext, cache: SpatialCache, waveType: int):
+    storage = GetVertexStorage(context)
+    if cache.storage is not storage:
+        storage.x[:] = cache.x[np.newaxis, :]
+        storage.y[:] = cache.y[:, np.newaxis]
+        cache.storage = storage
+
+    if waveType == WaveType.Single:
+        zx = context.amplitude * (cache.sinKX * cache.cosWT - cache.cosKX * cache.sinWT)
+    else:
+        zx = (2.0 * context.amplitude * cache.cosWT) * cache.sinKX
+
+    np.multiply(zx[np.newaxis, :], cache.decayY[:, np.newaxis], out=storage.z, casting="same_kind")
+    storage.SetParameters(context)
+
+# Absolute-time evaluation from cached factors: two scalar trig calls per frame
+def PropagateWaveCached(context: SimulationContext, time_val: float, waveType: int):
+    cache = GetSpatialCache(context)
+    cache.SetPhase(2.0 * PI * context.frequency * context.pitch, time_val)
+    _WriteCachedFrame(context, cache, waveType)
+
+# Advance the cached wave by dt using phase rotation and write the new frame
+# into context.storage. Starts from t = 0 (or the last PropagateWaveCached time)
+# and resynchronises the phasor if frequency or pitch changed.
+def StepWave(context: SimulationContext, dt: float, waveType: int) -> float:
+    cache = GetSpatialCache(context)
+    omega = 2.0 * PI * context.frequency * context.pitch
+    if cache.omega != omega:
+        cache.SetPhase(omega, cache.time)
+    cache.Rotate(dt)
+    _WriteCachedFrame(context, cache, waveType)
+    return cache.time
+
+# Propagate wave (single or counter-propagating)
+def PropagateWave(context: SimulationContext, time_val: float, waveType: int,
+                  mode: int = PropagationMode.Vectorized):
+    if mode == PropagationMode.Scalar:
+        PropagateWaveScalar(context, time_val, waveType)
+    elif mode == PropagationMode.Vectorized:
+        PropagateWaveVectorized(context, time_val, waveType)
+    elif mode == PropagationMode.Compact:
+        PropagateWaveCompact(context, time_val, waveType)
+    elif mode == PropagationMode.Cached:
+        PropagateWaveCached(context, time_val, waveType)
+    else:
+        raise ValueError(f"Unknown propagation mode: {mode}")
+
+# Evaluate z for many time values at once into a (T, ny, nx) cube.
+# When outputPath is given the cube is a .npy file opened with numpy.memmap
+# and filled chunkSize time steps at a time, so only one chunk of
+# intermediates is ever resident; the vertex buffer on the context is untouched.
+def PropagateWaveBatch(context: SimulationContext, times, waveType: int,
+                       out: np.ndarray = None, outputPath: str = None,
+                       chunkSize: int = 256, dtype=np.float64) -> np.ndarray:
+    times = np.asarray(times, dtype=np.float64).reshape(-1)
+    nx = context.numPointsX
+    ny = context.numPointsY
+    shape = (times.size, ny, nx)
+    k = 2.0 * PI / context.wavelength
+    omega = 2.0 * PI * context.frequency * context.pitch
+
+    if chunkSize <= 0:
+        raise ValueError("chunkSize must be positive")
+
+    if out is None:
+        if outputPath is not None:
+            out = np.lib.format.open_memmap(outputPath, mode="w+", dtype=dtype, shape=shape)
+        else:
+            out = np.empty(shape, dtype=dtype)
+    elif out.shape != shape:
+        raise ValueError(f"Output array has shape {out.shape}, expected {shape}")
+
+    x = np.arange(nx, dtype=np.float64) / nx * context.domainLengthX
+    y = np.arange(ny, dtype=np.float64) / ny * context.domainLengthY
+    kx = k * x
+    decayY = np.exp(-context.decayZ * y)
+
+    for start in range(0, times.size, chunkSize):
+        stop = min(start + chunkSize, times.size)
+        omegaT = omega * times[start:stop, np.newaxis]
+
+        if waveType == WaveType.Single:
+            zx = context.amplitude * np.sin(kx - omegaT)
+        else:
+            forwardZ = context.amplitude * np.sin(kx - omegaT)
+            backwardZ = context.amplitude * np.sin(kx + omegaT)
+            zx = forwardZ + backwardZ
+
+        np.multiply(zx[:, np.newaxis, :], decayY[np.newaxis, :, np.newaxis], out=out[start:stop])
+
+    if isinstance(out, np.memmap):
+        out.flush()
+    return out
+
+# Run both engines on copies of the context and return the largest absolute
+# difference in the vertex buffer (0.0 unless libm and NumPy disagree by an ulp)
+def CompareWaveModes(context: SimulationContext, time_val: float, waveType: int) -> float:
+    reference = copy.deepcopy(context)
+    candidate = copy.deepcopy(context)
+    PropagateWaveScalar(reference, time_val, waveType)
+    PropagateWaveVectorized(candidate, time_val, waveType)
+    return float(np.max(np.abs(reference.vertices - candidate.vertices), initial=0.0))
+
 # Example run (no graphics, just compute values)
 if __name__ == "__main__":
     context = SimulationContext()
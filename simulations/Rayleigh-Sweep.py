@@ -0,0 +1,141 @@
+import itertools
+import multiprocessing as mp
+import time
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import shared_memory
+
+import numpy as np
+
+from SimulationLoader import LoadSimulation
+
+RayleighSAW = LoadSimulation("Rayleigh-SAW")
+SimulationContext = RayleighSAW.SimulationContext
+WaveType = RayleighSAW.WaveType
+PropagateWaveBatch = RayleighSAW.PropagateWaveBatch
+
+# SimulationContext attributes a sweep is allowed to vary or copy to workers
+CONTEXT_PARAMETERS = ("numPointsX", "numPointsY", "domainLengthX", "domainLengthY",
+                      "amplitude", "frequency", "pitch", "wavelength", "decayZ")
+
+# Cartesian grid of SimulationContext parameters, e.g.
+#   SweepGrid(frequency=[1e4, 2e4], pitch=np.linspace(0.5, 2.0, 16))
+class SweepGrid:
+    def __init__(self, **axes):
+        if not axes:
+            raise ValueError("SweepGrid needs at least one parameter axis")
+        for name in axes:
+            if name not in CONTEXT_PARAMETERS[2:]:
+                raise ValueError(f"Cannot sweep over '{name}'")
+        self.axes = {name: np.asarray(values, dtype=np.float64).reshape(-1) for name, values in axes.items()}
+        self.names = tuple(self.axes)
+        self.shape = tuple(values.size for values in self.axes.values())
+
+    @property
+    def size(self) -> int:
+        return int(np.prod(self.shape))
+
+    def Point(self, flatIndex: int) -> dict:
+        index = np.unravel_index(flatIndex, self.shape)
+        return {name: float(self.axes[name][i]) for name, i in zip(self.names, index)}
+
+# Sweep output backed by shared memory: data has shape grid.shape + (T, ny, nx)
+class SweepResult:
+    def __init__(self, grid: SweepGrid, times: np.ndarray, shm: shared_memory.SharedMemory, shape: tuple):
+        self.grid = grid
+        self.times = times
+        self.wallTime = 0.0
+        self._shm = shm
+        self.data = np.ndarray(shape, dtype=np.float64, buffer=shm.buf)
+
+    def Select(self, **values) -> np.ndarray:
+        """Return the sub-array for the given parameter values (nearest grid point)."""
+        index = []
+        for name in self.grid.names:
+            if name in values:
+                index.append(int(np.argmin(np.abs(self.grid.axes[name] - values[name]))))
+            else:
+                index.append(slice(None))
+        return self.data[tuple(index)]
+
+    def Close(self):
+        """Release the shared memory block. `data` is invalid afterwards."""
+        if self._shm is not None:
+            self.data = None
+            self._shm.close()
+            self._shm.unlink()
+            self._shm = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.Close()
+
+# Per-process worker state, set up once by the pool initializer
+_worker = {}
+
+def _InitWorker(shmName: str, shape: tuple, grid: SweepGrid, base: dict, times: np.ndarray, waveType: int):
+    shm = shared_memory.SharedMemory(name=shmName)
+    _worker["shm"] = shm
+    _worker["data"] = np.ndarray(shape, dtype=np.float64, buffer=shm.buf).reshape((grid.size,) + shape[len(grid.shape):])
+    _worker["grid"] = grid
+    _worker["base"] = base
+    _worker["times"] = times
+    _worker["waveType"] = waveType
+
+def _ContextFor(base: dict, point: dict) -> SimulationContext:
+    context = SimulationContext()
+    for name, value in itertools.chain(base.items(), point.items()):
+        setattr(context, name, value)
+    context.vertices = np.zeros(0)
+    return context
+
+# Fill a contiguous range of flat grid indices in place; nothing but the range is pickled
+def _RunRange(start: int, stop: int) -> int:
+    data, grid = _worker["data"], _worker["grid"]
+    for flatIndex in range(start, stop):
+        context = _ContextFor(_worker["base"], grid.Point(flatIndex))
+        PropagateWaveBatch(context, _worker["times"], _worker["waveType"], out=data[flatIndex])
+    return stop - start
+
+def RunSweep(grid: SweepGrid, times, waveType: int = WaveType.CounterPropagating,
+             baseContext: SimulationContext = None, numWorkers: int = None,
+             tasksPerWorker: int = 4) -> SweepResult:
+    base = {name: getattr(baseContext or SimulationContext(), name) for name in CONTEXT_PARAMETERS}
+    times = np.asarray(times, dtype=np.float64).reshape(-1)
+    shape = grid.shape + (times.size, base["numPointsY"], base["numPointsX"])
+    numWorkers = numWorkers or mp.cpu_count()
+
+    start = time.perf_counter()
+    shm = shared_memory.SharedMemory(create=True, size=max(8 * int(np.prod(shape)), 1))
+    result = SweepResult(grid, times, shm, shape)
+    try:
+        numTasks = min(grid.size, numWorkers * tasksPerWorker)
+        edges = np.linspace(0, grid.size, numTasks + 1).round().astype(int)
+        with ProcessPoolExecutor(max_workers=numWorkers, initializer=_InitWorker,
+                                 initargs=(shm.name, shape, grid, base, times, waveType)) as pool:
+            futures = [pool.submit(_RunRange, int(a), int(b)) for a, b in zip(edges[:-1], edges[1:]) if b > a]
+            completed = sum(future.result() for future in futures)
+        if completed != grid.size:
+            raise RuntimeError(f"Sweep computed {completed} of {grid.size} points")
+    except BaseException:
+        result.Close()
+        raise
+    result.wallTime = time.perf_counter() - start
+    return result
+
+if __name__ == "__main__":
+    grid = SweepGrid(frequency=np.linspace(10000.0, 30000.0, 9),
+                     pitch=np.linspace(0.5, 2.0, 4),
+                     wavelength=[0.05, 0.1, 0.2])
+    times = np.linspace(0.0, 1.0e-3, 64)
+
+    with RunSweep(grid, times) as result:
+        print(f"Swept {grid.size} points x {times.size} frames -> {result.data.shape} "
+              f"in {result.wallTime:.2f} s on {mp.cpu_count()} core(s)")
+        peak = np.abs(result.data).max(axis=(-3, -2, -1))
+        for name in grid.names:
+            print(f"{name}: {grid.axes[name]}")
+        print(f"Peak |z| at frequency=20000, pitch=1, wavelength=0.1: "
+              f"{np.abs(result.Select(frequency=20000.0, pitch=1.0, wavelength=0.1)).max():.6f}")
+        print(f"Largest peak over the grid: {peak.max():.6f}")
@@ -0,0 +1,27 @@
+import importlib.util
+import os
+import sys
+
+SIMULATIONS_DIR = os.path.dirname(os.path.abspath(__file__))
+
+# Simulation scripts use hyphenated file names (Rayleigh-SAW.py) so they can't be
+# imported with a plain import statement. Load them by path and register them in
+# sys.modules under a stable name so worker processes can unpickle their objects.
+def LoadSimulation(name: str):
+    moduleName = name.replace("-", "")
+    if moduleName in sys.modules:
+        return sys.modules[moduleName]
+
+    path = os.path.join(SIMULATIONS_DIR, f"{name}.py")
+    spec = importlib.util.spec_from_file_location(moduleName, path)
+    if spec is None:
+        raise ImportError(f"Simulation '{name}' not found at '{path}'")
+
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[moduleName] = module
+    try:
+        spec.loader.exec_module(module)
+    except BaseException:
+        del sys.modules[moduleName]
+        raise
+    return module